@@ -7,64 +7,266 @@
 3. написати функцію, що об'єднує два відсортовані однозв'язні списки в один відсортований список
 """
 
+import contextvars
+import csv
+import heapq
+import json
+import math
+import mmap
+import os
+import queue
+import random
+import struct
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
 
 class ListNode:
     """Клас для представлення вузла однозв'язного списку"""
     
+    # Без __dict__ на кожен вузол: менше пам'яті та швидший доступ до полів
+    __slots__ = ("data", "next")
+    
     def __init__(self, data=None):
         self.data = data
         self.next = None
 
 
+def _chain_tail_and_length(head):
+    """
+    Знаходить хвіст і довжину ланцюжка вузлів
+    
+    Returns:
+        кортеж (хвіст, довжина); для порожнього ланцюжка (None, 0)
+    """
+    if not head:
+        return None, 0
+    
+    length = 1
+    while head.next:
+        head = head.next
+        length += 1
+    return head, length
+
+
+def _iter_chain_values(head):
+    """Генератор значень ланцюжка вузлів, починаючи з head"""
+    while head:
+        yield head.data
+        head = head.next
+
+
 class LinkedList:
-    """Клас для представлення однозв'язного списку"""
+    """
+    Клас для представлення однозв'язного списку
+    
+    Список зберігає посилання на хвіст і довжину, тому append та len()
+    працюють за O(1).
+    """
     
     def __init__(self):
-        self.head = None
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._reversing = False
+    
+    def _check_not_reversing(self):
+        """Забороняє доступ до ланцюжка, поки його реверсовано для reversed()"""
+        if self._reversing:
+            raise RuntimeError("Список використано під час зворотного обходу")
+    
+    @property
+    def head(self):
+        """Голова списку (ListNode або None)"""
+        self._check_not_reversing()
+        return self._head
+    
+    @head.setter
+    def head(self, node):
+        """Підставляє новий ланцюжок вузлів; хвіст і довжина перераховуються за O(n)"""
+        self._check_not_reversing()
+        self._head = node
+        self._tail, self._length = _chain_tail_and_length(node)
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        """Обходить значення списку без створення проміжних колекцій"""
+        self._check_not_reversing()
+        return self._iter_values()
+    
+    def _iter_values(self):
+        """Генератор значень, що перевіряє на кожному кроці, чи не почався reversed()"""
+        self._check_not_reversing()
+        node = self._head
+        while node:
+            yield node.data
+            # між yield виконується чужий код - перевіряємо до переходу за next
+            if self._reversing:
+                raise RuntimeError("Список реверсовано під час ітерації")
+            node = node.next
+    
+    def __reversed__(self):
+        """
+        Обходить значення у зворотному порядку
+        
+        Ланцюжок тимчасово реверсується на місці (O(1) пам'яті) і
+        відновлюється після завершення або переривання обходу. Поки обхід
+        триває, ітерація, індексація та зміни списку (а також інший
+        reversed()) кидають RuntimeError, як dict при зміні під час ітерації.
+        """
+        self._check_not_reversing()
+        self._reversing = True
+        head = reverse_linked_list(self._head)
+        try:
+            yield from _iter_chain_values(head)
+        finally:
+            reverse_linked_list(head)
+            self._reversing = False
+    
+    def __getitem__(self, index):
+        """Повертає значення за індексом (O(n)); підтримуються від'ємні індекси"""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Індекс поза межами списку")
+        return next(islice(self, index, None))
+    
+    def window(self, start, stop=None, step=1):
+        """
+        Лінивий зріз списку у стилі itertools.islice
+        
+        Args:
+            start: індекс першого елемента
+            stop: індекс, на якому зріз закінчується (None - до кінця)
+            step: крок
+        
+        Returns:
+            ітератор значень, що не копіює список
+        """
+        return islice(self, start, stop, step)
     
     def append(self, data):
         """Додає новий елемент в кінець списку"""
+        self._check_not_reversing()
         new_node = ListNode(data)
-        if not self.head:
-            self.head = new_node
-            return
-        
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
+        if not self._head:
+            self._head = new_node
+        else:
+            self._tail.next = new_node
+        self._tail = new_node
+        self._length += 1
     
     def prepend(self, data):
         """Додає новий елемент на початок списку"""
+        self._check_not_reversing()
         new_node = ListNode(data)
-        new_node.next = self.head
-        self.head = new_node
+        new_node.next = self._head
+        self._head = new_node
+        if not self._tail:
+            self._tail = new_node
+        self._length += 1
+    
+    def _detach_chain(self, other):
+        """
+        Повертає (голова, хвіст, довжина) ланцюжка для злиття зі списком
+        
+        Якщо other - LinkedList, його вузли забираються, а сам він стає порожнім.
+        Якщо other - ListNode, ланцюжок використовується як є (хвіст шукається за O(k)).
+        """
+        self._check_not_reversing()
+        if isinstance(other, LinkedList):
+            if other is self:
+                raise ValueError("Неможливо приєднати список сам до себе")
+            other._check_not_reversing()
+            chain = (other._head, other._tail, other._length)
+            other._head, other._tail, other._length = None, None, 0
+            return chain
+        
+        tail, length = _chain_tail_and_length(other)
+        return other, tail, length
+    
+    def extend(self, other):
+        """
+        Приєднує ланцюжок вузлів у кінець списку без копіювання
+        
+        Args:
+            other: LinkedList (стає порожнім) або голова ланцюжка ListNode
+        """
+        head, tail, length = self._detach_chain(other)
+        if not head:
+            return
+        
+        if self._tail:
+            self._tail.next = head
+        else:
+            self._head = head
+        self._tail = tail
+        self._length += length
+    
+    def extend_left(self, other):
+        """
+        Приєднує ланцюжок вузлів на початок списку без копіювання
+        
+        Args:
+            other: LinkedList (стає порожнім) або голова ланцюжка ListNode
+        """
+        head, tail, length = self._detach_chain(other)
+        if not head:
+            return
+        
+        tail.next = self._head
+        self._head = head
+        if not self._tail:
+            self._tail = tail
+        self._length += length
     
     def display(self):
         """Виводить всі елементи списку"""
-        elements = []
-        current = self.head
-        while current:
-            elements.append(str(current.data))
-            current = current.next
-        return " -> ".join(elements) + " -> None"
+        return " -> ".join(map(str, self)) + " -> None"
     
     def to_list(self):
         """Конвертує список в Python list для зручності тестування"""
-        result = []
-        current = self.head
-        while current:
-            result.append(current.data)
-            current = current.next
-        return result
+        return list(self)
     
     @classmethod
-    def from_list(cls, data_list):
-        """Створює список з Python list"""
+    def from_iterable(cls, iterable):
+        """
+        Створює список з довільного ітерованого об'єкта за один лінійний прохід
+        
+        Args:
+            iterable: список, генератор, numpy-масив тощо
+        """
+        # numpy-масиви перетворюємо на Python-значення одним викликом
+        if hasattr(iterable, "tolist"):
+            iterable = iterable.tolist()
+        
         linked_list = cls()
-        for item in data_list:
-            linked_list.append(item)
+        dummy = ListNode()
+        tail = dummy
+        length = 0
+        for item in iterable:
+            tail.next = ListNode(item)
+            tail = tail.next
+            length += 1
+        
+        if length:
+            linked_list._head = dummy.next
+            linked_list._tail = tail
+            linked_list._length = length
         return linked_list
+    
+    @classmethod
+    def from_list(cls, data_list):
+        """Створює список з Python list"""
+        return cls.from_iterable(data_list)
 
 
 def reverse_linked_list(head):
@@ -92,21 +294,100 @@ def reverse_linked_list(head):
     return prev
 
 
-def insertion_sort_linked_list(head):
+class _KeyedNode(ListNode):
+    """Вузол-замісник для сортування за ключем: data - обчислений ключ, node - вихідний вузол"""
+    
+    __slots__ = ("node",)
+    
+    def __init__(self, data, node):
+        super().__init__(data)
+        self.node = node
+
+
+def _decorated_sort(head, sort, key, reverse):
+    """
+    Сортує ланцюжок функцією sort з підтримкою key та reverse
+    
+    Ключ обчислюється рівно один раз для кожного вузла й зберігається у
+    вузлі-замісникові; sort працює із замісниками, після чого вихідні
+    вузли перев'язуються в знайденому порядку. reverse реалізовано як у
+    list.sort: реверс, стабільне сортування за зростанням, реверс - тому
+    рівні елементи зберігають вихідний порядок.
+    """
+    if reverse:
+        head = reverse_linked_list(head)
+    
+    if key is not None:
+        dummy = _new_node()
+        tail = dummy
+        node = head
+        while node:
+            tail.next = _KeyedNode(key(node.data), node)
+            tail = tail.next
+            node = node.next
+        
+        proxy = sort(dummy.next)
+        dummy.next = None
+        tail = dummy
+        while proxy:
+            tail.next = proxy.node
+            tail = tail.next
+            proxy = proxy.next
+        tail.next = None
+        head = dummy.next
+    else:
+        head = sort(head)
+    
+    if reverse:
+        head = reverse_linked_list(head)
+    return head
+
+
+class _ReverseKey:
+    """Обгортка ключа з оберненим порядком для злиття списків, відсортованих за спаданням"""
+    
+    __slots__ = ("key",)
+    
+    def __init__(self, key):
+        self.key = key
+    
+    def __lt__(self, other):
+        return other.key < self.key
+    
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+def _merge_key(key, reverse):
+    """Функція ключа купи для K-way злиття (None - порівнювати значення напряму)"""
+    if key is None and not reverse:
+        return None
+    if not reverse:
+        return key
+    if key is None:
+        return _ReverseKey
+    return lambda data: _ReverseKey(key(data))
+
+
+def insertion_sort_linked_list(head, key=None, reverse=False):
     """
     Сортування вставками для однозв'язного списку
     
     Args:
         head: початок списку (ListNode)
+        key: функція ключа сортування (обчислюється один раз на вузол)
+        reverse: сортувати за спаданням
     
     Returns:
         нова голова відсортованого списку
     """
     if not head or not head.next:
         return head
+    if key is not None or reverse:
+        return _decorated_sort(head, insertion_sort_linked_list, key, reverse)
     
     # Створюємо dummy вузол для спрощення логіки
-    dummy = ListNode(0)
+    dummy = _new_node(0)
     dummy.next = head
     current = head.next
     last_sorted = head
@@ -122,8 +403,9 @@ def insertion_sort_linked_list(head):
             last_sorted.next = current.next
             
             # Знаходимо правильне місце для вставки
+            # (<= зберігає порядок рівних елементів - сортування стабільне)
             prev = dummy
-            while prev.next.data < current.data:
+            while prev.next.data <= current.data:
                 prev = prev.next
             
             # Вставляємо вузол
@@ -136,19 +418,24 @@ def insertion_sort_linked_list(head):
     return dummy.next
 
 
-def merge_sorted_lists(head1, head2):
+def merge_sorted_lists(head1, head2, key=None, reverse=False):
     """
     Об'єднує два відсортовані однозв'язні списки в один відсортований список
     
     Args:
         head1: голова першого відсортованого списку
         head2: голова другого відсортованого списку
+        key: функція ключа, за яким відсортовані списки (обчислюється один раз на вузол)
+        reverse: списки відсортовані за спаданням
     
     Returns:
         голова об'єднаного відсортованого списку
     """
+    if key is not None or reverse:
+        return _merge_sorted_lists_by_key(head1, head2, key, reverse)
+    
     # Створюємо dummy вузол для спрощення логіки
-    dummy = ListNode(0)
+    dummy = _new_node(0)
     tail = dummy
     
     # Порівнюємо елементи з обох списків і об'єднуємо їх
@@ -170,69 +457,2801 @@ def merge_sorted_lists(head1, head2):
     return dummy.next
 
 
-def test_linked_list_functionality():
-    """Тестування всіх функцій"""
-    print("=== Тестування однозв'язного списку ===\n")
+def _merge_sorted_lists_by_key(head1, head2, key, reverse):
+    """Стабільне злиття двох списків з ключем та/або за спаданням (див. merge_sorted_lists)"""
+    if key is None:
+        def key(data):
+            return data
     
-    # Тест 1: Створення списку та додавання елементів
-    print("1. Створення списку та додавання елементів:")
-    ll = LinkedList()
-    ll.append(3)
-    ll.append(1)
-    ll.append(4)
-    ll.append(2)
-    ll.prepend(0)
-    print(f"Список: {ll.display()}")
-    print()
+    dummy = _new_node(0)
+    tail = dummy
+    key1 = key(head1.data) if head1 else None
+    key2 = key(head2.data) if head2 else None
     
-    # Тест 2: Реверсування списку
-    print("2. Реверсування списку:")
-    print(f"Оригінальний список: {ll.display()}")
-    reversed_head = reverse_linked_list(ll.head)
+    while head1 and head2:
+        # При рівних ключах першим іде елемент першого списку
+        if (key2 <= key1) if reverse else (key1 <= key2):
+            tail.next = head1
+            head1 = head1.next
+            if head1:
+                key1 = key(head1.data)
+        else:
+            tail.next = head2
+            head2 = head2.next
+            if head2:
+                key2 = key(head2.data)
+        tail = tail.next
     
-    # Створюємо новий список для відображення реверсованого
-    reversed_ll = LinkedList()
-    reversed_ll.head = reversed_head
-    print(f"Реверсований список: {reversed_ll.display()}")
-    print()
+    tail.next = head1 if head1 else head2
+    return dummy.next
+
+
+def _heads_heap(heads, sort_key=None):
+    """Будує min-купу (ключ, номер списку, вузол) з голів списків"""
+    if sort_key is None:
+        heap = [(head.data, index, head) for index, head in enumerate(heads) if head]
+    else:
+        heap = [(sort_key(head.data), index, head) for index, head in enumerate(heads) if head]
+    heapq.heapify(heap)
+    return heap
+
+
+def merge_k_sorted_lists(heads, key=None, reverse=False):
+    """
+    Об'єднує довільну кількість відсортованих однозв'язних списків
     
-    # Тест 3: Сортування вставками
-    print("3. Сортування вставками:")
-    ll2 = LinkedList.from_list([5, 2, 8, 1, 9, 3])
-    print(f"До сортування: {ll2.display()}")
-    sorted_head = insertion_sort_linked_list(ll2.head)
+    Використовує min-купу поточних голів, тому працює за O(n log K).
+    Злиття стабільне: рівні елементи йдуть у порядку номерів списків.
     
-    sorted_ll = LinkedList()
-    sorted_ll.head = sorted_head
-    print(f"Після сортування: {sorted_ll.display()}")
-    print()
+    Args:
+        heads: послідовність голів відсортованих списків (ListNode або None)
+        key: функція ключа, за яким відсортовані списки (обчислюється один раз на вузол)
+        reverse: списки відсортовані за спаданням
     
-    # Тест 4: Об'єднання двох відсортованих списків
-    print("4. Об'єднання двох відсортованих списків:")
-    list1 = LinkedList.from_list([1, 3, 5, 7])
-    list2 = LinkedList.from_list([2, 4, 6, 8])
-    print(f"Список 1: {list1.display()}")
-    print(f"Список 2: {list2.display()}")
+    Returns:
+        голова об'єднаного відсортованого списку
+    """
+    sort_key = _merge_key(key, reverse)
+    heap = _heads_heap(heads, sort_key)
+    dummy = _new_node(0)
+    tail = dummy
     
-    merged_head = merge_sorted_lists(list1.head, list2.head)
-    merged_ll = LinkedList()
-    merged_ll.head = merged_head
-    print(f"Об'єднаний список: {merged_ll.display()}")
-    print()
+    while len(heap) > 1:
+        _, index, node = heap[0]
+        following = node.next
+        if following:
+            value = following.data if sort_key is None else sort_key(following.data)
+            heapq.heapreplace(heap, (value, index, following))
+        else:
+            heapq.heappop(heap)
+        tail.next = node
+        tail = node
     
-    # Тест 5: Об'єднання списків різної довжини
-    print("5. Об'єднання списків різної довжини:")
-    list3 = LinkedList.from_list([1, 5, 9])
-    list4 = LinkedList.from_list([2, 3, 6, 7, 10, 11])
-    print(f"Список 3: {list3.display()}")
-    print(f"Список 4: {list4.display()}")
+    # Залишок останнього списку приєднуємо без порівнянь
+    tail.next = heap[0][2] if heap else None
+    return dummy.next
+
+
+def iter_merge_sorted_lists(heads, key=None, reverse=False):
+    """
+    Генератор, що ліниво повертає значення злиття відсортованих списків
     
-    merged_head2 = merge_sorted_lists(list3.head, list4.head)
-    merged_ll2 = LinkedList()
-    merged_ll2.head = merged_head2
-    print(f"Об'єднаний список: {merged_ll2.display()}")
+    Списки не змінюються; наступний вузол кожного списку читається лише
+    тоді, коли споживач запитує чергове значення.
+    
+    Args:
+        heads: послідовність голів відсортованих списків (ListNode або None)
+        key: функція ключа, за яким відсортовані списки
+        reverse: списки відсортовані за спаданням
+    
+    Yields:
+        значення у відсортованому порядку
+    """
+    sort_key = _merge_key(key, reverse)
+    heap = _heads_heap(heads, sort_key)
+    
+    while heap:
+        _, index, node = heap[0]
+        following = node.next
+        if following:
+            value = following.data if sort_key is None else sort_key(following.data)
+            heapq.heapreplace(heap, (value, index, following))
+        else:
+            heapq.heappop(heap)
+        yield node.data
+
+
+# Довжина серій, які сортуються вставками перед злиттям
+INSERTION_SORT_RUN = 16
+
+
+def _split_after(head, count):
+    """
+    Відрізає від списку перші count вузлів
+    
+    Args:
+        head: початок списку (ListNode)
+        count: кількість вузлів, що залишаються в першій частині
+    
+    Returns:
+        голова залишку списку (або None)
+    """
+    for _ in range(count - 1):
+        if not head:
+            return None
+        head = head.next
+    
+    if not head:
+        return None
+    
+    rest = head.next
+    head.next = None
+    return rest
+
+
+def _tail_of(head):
+    """Повертає останній вузол непорожнього списку"""
+    while head.next:
+        head = head.next
+    return head
+
+
+def merge_sort_linked_list(head, run_size=INSERTION_SORT_RUN, key=None, reverse=False):
+    """
+    Ітеративне сортування злиттям знизу вгору для однозв'язного списку
+    
+    Працює за O(n log n) без рекурсії та з O(1) додаткової пам'яті: вузли
+    лише перев'язуються. Короткі серії довжиною run_size спочатку
+    сортуються вставками, далі серії подвоюються через merge_sorted_lists.
+    
+    Args:
+        head: початок списку (ListNode)
+        run_size: довжина серій для сортування вставками (1 - без них)
+        key: функція ключа сортування (обчислюється один раз на вузол)
+        reverse: сортувати за спаданням
+    
+    Returns:
+        нова голова відсортованого списку
+    """
+    if not head or not head.next:
+        return head
+    if key is not None or reverse:
+        return _decorated_sort(head, lambda chain: merge_sort_linked_list(chain, run_size),
+                               key, reverse)
+    
+    dummy = _new_node(0)
+    dummy.next = head
+    width = 1
+    
+    # Прохід 0: сортуємо вставками короткі серії
+    if run_size > 1:
+        tail = dummy
+        current = head
+        while current:
+            rest = _split_after(current, run_size)
+            tail.next = insertion_sort_linked_list(current)
+            tail = _tail_of(tail.next)
+            current = rest
+        width = run_size
+    
+    # Зливаємо сусідні серії, подвоюючи їх довжину на кожному проході
+    while True:
+        tail = dummy
+        current = dummy.next
+        merges = 0
+        
+        while current:
+            left = current
+            right = _split_after(left, width)
+            current = _split_after(right, width) if right else None
+            tail.next = merge_sorted_lists(left, right)
+            tail = _tail_of(tail.next)
+            merges += 1
+        
+        if merges <= 1:
+            break
+        width *= 2
+    
+    return dummy.next
+
+
+def _take_run(head, min_run):
+    """
+    Відокремлює від списку чергову природну серію
+    
+    Спадна серія (строго спадна, щоб зберегти стабільність) реверсується
+    на місці. Якщо серія коротша за min_run, вона доповнюється наступними
+    вузлами та сортується вставками.
+    
+    Args:
+        head: початок непорожнього списку (ListNode)
+        min_run: мінімальна довжина серії
+    
+    Returns:
+        кортеж (голова серії, довжина серії, залишок списку)
+    """
+    length = 1
+    current = head
+    
+    if head.next and head.next.data < head.data:
+        while current.next and current.next.data < current.data:
+            current = current.next
+            length += 1
+        rest = current.next
+        current.next = None
+        # Після реверсування колишня голова стає хвостом
+        tail = head
+        head = reverse_linked_list(head)
+    else:
+        while current.next and current.next.data >= current.data:
+            current = current.next
+            length += 1
+        rest = current.next
+        current.next = None
+        tail = current
+    
+    if length < min_run and rest:
+        extra = rest
+        rest = _split_after(extra, min_run - length)
+        tail.next = extra
+        while tail.next:
+            tail = tail.next
+            length += 1
+        head = insertion_sort_linked_list(head)
+    
+    return head, length, rest
+
+
+def _merge_runs_at(runs, i, merge):
+    """Зливає серії runs[i] та runs[i + 1] на стеку серій функцією merge"""
+    left_head, left_length = runs[i]
+    right_head, right_length = runs[i + 1]
+    runs[i] = (merge(left_head, right_head), left_length + right_length)
+    del runs[i + 1]
+
+
+def _collapse_runs(runs, merge):
+    """Зливає верхні серії стеку, доки не виконуються інваріанти балансу Timsort"""
+    while len(runs) > 1:
+        n = len(runs) - 1
+        if (n >= 2 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]) or \
+           (n >= 3 and runs[n - 3][1] <= runs[n - 2][1] + runs[n - 1][1]):
+            if runs[n - 2][1] < runs[n][1]:
+                n -= 1
+        elif runs[n - 1][1] > runs[n][1]:
+            break
+        _merge_runs_at(runs, n - 1, merge)
+
+
+def _merge_remaining_runs(runs, merge):
+    """Зливає залишок стеку серій справа наліво та повертає голову результату"""
+    while len(runs) > 1:
+        _merge_runs_at(runs, len(runs) - 2, merge)
+    return runs[0][0]
+
+
+def adaptive_sort_linked_list(head, min_run=INSERTION_SORT_RUN, key=None, reverse=False):
+    """
+    Адаптивне сортування природними серіями (у стилі Timsort)
+    
+    Список розбивається на зростаючі та спадні серії, спадні реверсуються
+    через reverse_linked_list. Серії зливаються за правилами балансу
+    Timsort, тому вже відсортований список обробляється за O(n), а
+    найгірший випадок залишається O(n log n). Сортування стабільне.
+    
+    Args:
+        head: початок списку (ListNode)
+        min_run: мінімальна довжина серії (коротші доповнюються вставками)
+        key: функція ключа сортування (обчислюється один раз на вузол)
+        reverse: сортувати за спаданням
+    
+    Returns:
+        нова голова відсортованого списку
+    """
+    if not head or not head.next:
+        return head
+    if key is not None or reverse:
+        return _decorated_sort(head, lambda chain: adaptive_sort_linked_list(chain, min_run),
+                               key, reverse)
+    
+    runs = []  # стек серій: (голова, довжина)
+    rest = head
+    
+    while rest:
+        run_head, length, rest = _take_run(rest, min_run)
+        runs.append((run_head, length))
+        _collapse_runs(runs, merge_sorted_lists)
+    
+    return _merge_remaining_runs(runs, merge_sorted_lists)
+
+
+def sort_linked_list(head, algorithm="merge", run_size=INSERTION_SORT_RUN, key=None,
+                     reverse=False):
+    """
+    Сортує однозв'язний список обраним алгоритмом
+    
+    Args:
+        head: початок списку (ListNode)
+        algorithm: "merge" - злиттям знизу вгору, "adaptive" - природними
+            серіями, "insertion" - вставками
+        run_size: довжина серій для сортування вставками у режимах
+            "merge" та "adaptive"
+        key: функція ключа сортування (обчислюється один раз на вузол)
+        reverse: сортувати за спаданням (сортування залишається стабільним)
+    
+    Returns:
+        нова голова відсортованого списку
+    """
+    if algorithm == "merge":
+        return merge_sort_linked_list(head, run_size, key, reverse)
+    if algorithm == "adaptive":
+        return adaptive_sort_linked_list(head, run_size, key, reverse)
+    if algorithm == "insertion":
+        return insertion_sort_linked_list(head, key, reverse)
+    raise ValueError(f"Невідомий алгоритм сортування: {algorithm}")
+
+
+# Позначка відсутнього вузла в індексних посиланнях (аналог None)
+NIL = -1
+
+
+class ArrayNodePool:
+    """
+    Пул вузлів однозв'язного списку в типізованих масивах
+    
+    Значення зберігаються в одному масиві array, індекси наступних вузлів -
+    в іншому. Замість об'єкта ListNode вузол - це просто індекс у пулі,
+    тому 10M вузлів займають ~160 МБ замість кількох гігабайт. Масиви
+    виділяються наперед і зростають геометрично (удвічі).
+    """
+    
+    def __init__(self, typecode="d", capacity=16):
+        """
+        Args:
+            typecode: тип значень модуля array ("d" - float, "q" - int64 тощо)
+            capacity: початкова кількість вузлів
+        """
+        capacity = max(capacity, 1)
+        self.typecode = typecode
+        self.values = array(typecode, [0]) * capacity
+        self.next = array("q", [NIL]) * capacity
+        self.size = 0
+    
+    def __len__(self):
+        return self.size
+    
+    @property
+    def capacity(self):
+        """Кількість вузлів, під які вже виділено пам'ять"""
+        return len(self.values)
+    
+    def reserve(self, capacity):
+        """Гарантує місце щонайменше для capacity вузлів (зростання удвічі)"""
+        current = len(self.values)
+        if capacity <= current:
+            return
+        
+        new_capacity = max(current, 1)
+        while new_capacity < capacity:
+            new_capacity *= 2
+        extra = new_capacity - current
+        self.values.extend(array(self.typecode, [0]) * extra)
+        self.next.extend(array("q", [NIL]) * extra)
+    
+    def allocate(self, data):
+        """Створює новий вузол і повертає його індекс"""
+        if self.size == len(self.values):
+            self.reserve(self.size + 1)
+        index = self.size
+        self.values[index] = data
+        self.next[index] = NIL
+        self.size += 1
+        return index
+    
+    def allocate_chain(self, iterable):
+        """
+        Створює ланцюжок вузлів з ітерованого об'єкта за один прохід
+        
+        Returns:
+            кортеж (голова, хвіст, довжина); для порожнього входу (NIL, NIL, 0)
+        """
+        if isinstance(iterable, array) and iterable.typecode == self.typecode:
+            chunk = iterable
+        else:
+            if hasattr(iterable, "tolist"):
+                iterable = iterable.tolist()
+            chunk = array(self.typecode, iterable)
+        count = len(chunk)
+        if not count:
+            return NIL, NIL, 0
+        
+        start = self.size
+        end = start + count
+        self.reserve(end)
+        self.values[start:end] = chunk
+        self.next[start:end - 1] = array("q", range(start + 1, end))
+        self.next[end - 1] = NIL
+        self.size = end
+        return start, end - 1, count
+
+
+class ArrayLinkedList:
+    """
+    Однозв'язний список, вузли якого зберігаються в ArrayNodePool
+    
+    Кілька списків можуть спільно використовувати один пул - тоді їх
+    можна зливати без копіювання значень.
+    """
+    
+    def __init__(self, typecode="d", capacity=16, pool=None):
+        self.pool = pool if pool is not None else ArrayNodePool(typecode, capacity)
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+    
+    def __len__(self):
+        return self.length
+    
+    def append(self, data):
+        """Додає новий елемент в кінець списку"""
+        index = self.pool.allocate(data)
+        if self.head == NIL:
+            self.head = index
+        else:
+            self.pool.next[self.tail] = index
+        self.tail = index
+        self.length += 1
+    
+    def prepend(self, data):
+        """Додає новий елемент на початок списку"""
+        index = self.pool.allocate(data)
+        self.pool.next[index] = self.head
+        self.head = index
+        if self.tail == NIL:
+            self.tail = index
+        self.length += 1
+    
+    def extend(self, iterable):
+        """Додає елементи в кінець списку одним блоком пулу"""
+        head, tail, length = self.pool.allocate_chain(iterable)
+        if head == NIL:
+            return
+        if self.head == NIL:
+            self.head = head
+        else:
+            self.pool.next[self.tail] = head
+        self.tail = tail
+        self.length += length
+    
+    def _set_chain(self, head):
+        """Підставляє новий ланцюжок і перераховує хвіст за O(n)"""
+        self.head = head
+        self.tail = NIL if head == NIL else _indexed_tail(self.pool.next, head)
+    
+    def reverse(self):
+        """Реверсує список на місці"""
+        self.tail = self.head
+        self.head = reverse_indexed_list(self.pool, self.head)
+    
+    def sort(self, algorithm="merge", run_size=INSERTION_SORT_RUN):
+        """Сортує список на місці (див. sort_indexed_list)"""
+        self._set_chain(sort_indexed_list(self.pool, self.head, algorithm, run_size))
+    
+    def merge(self, other):
+        """
+        Зливає інший відсортований список з тим самим пулом у цей список
+        
+        Після злиття other стає порожнім.
+        """
+        if other is self:
+            raise ValueError("Неможливо злити список сам із собою")
+        if other.pool is not self.pool:
+            raise ValueError("Списки мають використовувати спільний пул вузлів")
+        self.length += other.length
+        self._set_chain(merge_sorted_indexed_lists(self.pool, self.head, other.head))
+        other.head, other.tail, other.length = NIL, NIL, 0
+    
+    def __iter__(self):
+        """Обходить значення списку за індексними посиланнями"""
+        values, nxt = self.pool.values, self.pool.next
+        current = self.head
+        while current != NIL:
+            yield values[current]
+            current = nxt[current]
+    
+    def display(self):
+        """Виводить всі елементи списку"""
+        return " -> ".join(map(str, self)) + " -> None"
+    
+    def to_list(self):
+        """Конвертує список в Python list"""
+        return list(self)
+    
+    def to_linked_list(self):
+        """Конвертує список у звичайний LinkedList з вузлами ListNode"""
+        return LinkedList.from_iterable(self)
+    
+    @classmethod
+    def from_iterable(cls, iterable, typecode="d", pool=None):
+        """Створює список з довільного ітерованого об'єкта за один прохід"""
+        array_list = cls(typecode, pool=pool)
+        array_list.extend(iterable)
+        return array_list
+    
+    @classmethod
+    def from_list(cls, data_list, typecode="d", pool=None):
+        """Створює список з Python list"""
+        return cls.from_iterable(data_list, typecode, pool)
+    
+    @classmethod
+    def from_nodes(cls, head, typecode="d", pool=None):
+        """Створює список з ланцюжка ListNode (або LinkedList)"""
+        if isinstance(head, LinkedList):
+            head = head.head
+        return cls.from_iterable(_iter_chain_values(head), typecode, pool)
+
+
+def _split_indexed_after(nxt, head, count):
+    """Відрізає перші count вузлів індексного списку, повертає голову залишку"""
+    for _ in range(count - 1):
+        if head == NIL:
+            return NIL
+        head = nxt[head]
+    
+    if head == NIL:
+        return NIL
+    
+    rest = nxt[head]
+    nxt[head] = NIL
+    return rest
+
+
+def _indexed_tail(nxt, head):
+    """Повертає індекс останнього вузла непорожнього індексного списку"""
+    while nxt[head] != NIL:
+        head = nxt[head]
+    return head
+
+
+def reverse_indexed_list(pool, head):
+    """
+    Реверсує індексний список, змінюючи індекси наступних вузлів
+    
+    Args:
+        pool: пул вузлів (ArrayNodePool)
+        head: індекс голови списку (NIL для порожнього)
+    
+    Returns:
+        індекс нової голови
+    """
+    nxt = pool.next
+    prev = NIL
+    current = head
+    
+    while current != NIL:
+        next_temp = nxt[current]
+        nxt[current] = prev
+        prev = current
+        current = next_temp
+    
+    return prev
+
+
+def insertion_sort_indexed_list(pool, head):
+    """
+    Стабільне сортування вставками для індексного списку
+    
+    Args:
+        pool: пул вузлів (ArrayNodePool)
+        head: індекс голови списку
+    
+    Returns:
+        індекс нової голови
+    """
+    values, nxt = pool.values, pool.next
+    if head == NIL or nxt[head] == NIL:
+        return head
+    
+    last_sorted = head
+    current = nxt[head]
+    
+    while current != NIL:
+        if values[current] >= values[last_sorted]:
+            last_sorted = current
+            current = nxt[current]
+            continue
+        
+        # Видаляємо поточний вузол і вставляємо його у відсортовану частину
+        nxt[last_sorted] = nxt[current]
+        if values[current] < values[head]:
+            nxt[current] = head
+            head = current
+        else:
+            prev = head
+            while values[nxt[prev]] <= values[current]:
+                prev = nxt[prev]
+            nxt[current] = nxt[prev]
+            nxt[prev] = current
+        
+        current = nxt[last_sorted]
+    
+    return head
+
+
+def merge_sorted_indexed_lists(pool, head1, head2):
+    """
+    Об'єднує два відсортовані індексні списки одного пулу
+    
+    Args:
+        pool: пул вузлів (ArrayNodePool)
+        head1: індекс голови першого відсортованого списку
+        head2: індекс голови другого відсортованого списку
+    
+    Returns:
+        індекс голови об'єднаного відсортованого списку
+    """
+    values, nxt = pool.values, pool.next
+    if head1 == NIL:
+        return head2
+    if head2 == NIL:
+        return head1
+    
+    if values[head1] <= values[head2]:
+        head = tail = head1
+        head1 = nxt[head1]
+    else:
+        head = tail = head2
+        head2 = nxt[head2]
+    
+    while head1 != NIL and head2 != NIL:
+        if values[head1] <= values[head2]:
+            nxt[tail] = head1
+            tail = head1
+            head1 = nxt[head1]
+        else:
+            nxt[tail] = head2
+            tail = head2
+            head2 = nxt[head2]
+    
+    nxt[tail] = head1 if head1 != NIL else head2
+    return head
+
+
+def merge_sort_indexed_list(pool, head, run_size=INSERTION_SORT_RUN):
+    """
+    Ітеративне сортування злиттям знизу вгору для індексного списку
+    
+    Аналог merge_sort_linked_list: O(n log n), без рекурсії та з O(1)
+    додаткової пам'яті.
+    
+    Args:
+        pool: пул вузлів (ArrayNodePool)
+        head: індекс голови списку
+        run_size: довжина серій для сортування вставками (1 - без них)
+    
+    Returns:
+        індекс нової голови
+    """
+    nxt = pool.next
+    if head == NIL or nxt[head] == NIL:
+        return head
+    
+    width = 1
+    
+    # Прохід 0: сортуємо вставками короткі серії
+    if run_size > 1:
+        current, head, tail = head, NIL, NIL
+        while current != NIL:
+            rest = _split_indexed_after(nxt, current, run_size)
+            run = insertion_sort_indexed_list(pool, current)
+            if tail == NIL:
+                head = run
+            else:
+                nxt[tail] = run
+            tail = _indexed_tail(nxt, run)
+            current = rest
+        width = run_size
+    
+    # Зливаємо сусідні серії, подвоюючи їх довжину на кожному проході
+    while True:
+        current, head, tail = head, NIL, NIL
+        merges = 0
+        
+        while current != NIL:
+            left = current
+            right = _split_indexed_after(nxt, left, width)
+            current = _split_indexed_after(nxt, right, width) if right != NIL else NIL
+            run = merge_sorted_indexed_lists(pool, left, right)
+            if tail == NIL:
+                head = run
+            else:
+                nxt[tail] = run
+            tail = _indexed_tail(nxt, run)
+            merges += 1
+        
+        if merges <= 1:
+            break
+        width *= 2
+    
+    return head
+
+
+def _take_indexed_run(pool, head, min_run):
+    """Індексний аналог _take_run: повертає (голова серії, довжина, залишок)"""
+    values, nxt = pool.values, pool.next
+    length = 1
+    current = head
+    
+    if nxt[head] != NIL and values[nxt[head]] < values[head]:
+        while nxt[current] != NIL and values[nxt[current]] < values[current]:
+            current = nxt[current]
+            length += 1
+        rest = nxt[current]
+        nxt[current] = NIL
+        tail = head
+        head = reverse_indexed_list(pool, head)
+    else:
+        while nxt[current] != NIL and values[nxt[current]] >= values[current]:
+            current = nxt[current]
+            length += 1
+        rest = nxt[current]
+        nxt[current] = NIL
+        tail = current
+    
+    if length < min_run and rest != NIL:
+        extra = rest
+        rest = _split_indexed_after(nxt, extra, min_run - length)
+        nxt[tail] = extra
+        while nxt[tail] != NIL:
+            tail = nxt[tail]
+            length += 1
+        head = insertion_sort_indexed_list(pool, head)
+    
+    return head, length, rest
+
+
+def adaptive_sort_indexed_list(pool, head, min_run=INSERTION_SORT_RUN):
+    """
+    Адаптивне сортування природними серіями для індексного списку
+    
+    Аналог adaptive_sort_linked_list: O(n) для відсортованого входу,
+    O(n log n) у найгіршому випадку, сортування стабільне.
+    
+    Args:
+        pool: пул вузлів (ArrayNodePool)
+        head: індекс голови списку
+        min_run: мінімальна довжина серії
+    
+    Returns:
+        індекс нової голови
+    """
+    if head == NIL or pool.next[head] == NIL:
+        return head
+    
+    def merge(left, right):
+        return merge_sorted_indexed_lists(pool, left, right)
+    
+    runs = []
+    rest = head
+    while rest != NIL:
+        run_head, length, rest = _take_indexed_run(pool, rest, min_run)
+        runs.append((run_head, length))
+        _collapse_runs(runs, merge)
+    
+    return _merge_remaining_runs(runs, merge)
+
+
+def sort_indexed_list(pool, head, algorithm="merge", run_size=INSERTION_SORT_RUN):
+    """
+    Сортує індексний список обраним алгоритмом (див. sort_linked_list)
+    
+    Args:
+        pool: пул вузлів (ArrayNodePool)
+        head: індекс голови списку
+        algorithm: "merge", "adaptive" або "insertion"
+        run_size: довжина серій для сортування вставками
+    
+    Returns:
+        індекс нової голови
+    """
+    if algorithm == "merge":
+        return merge_sort_indexed_list(pool, head, run_size)
+    if algorithm == "adaptive":
+        return adaptive_sort_indexed_list(pool, head, run_size)
+    if algorithm == "insertion":
+        return insertion_sort_indexed_list(pool, head)
+    raise ValueError(f"Невідомий алгоритм сортування: {algorithm}")
+
+
+# Оцінка пам'яті на один елемент у ланцюжку ListNode (вузол + значення)
+_NODE_BYTES = sys.getsizeof(ListNode()) + sys.getsizeof(0.0)
+
+
+class ExternalSorter:
+    """
+    Зовнішнє сортування послідовностей, що не вміщуються в пам'ять
+    
+    Вхідний потік розрізається на серії обмеженого розміру, кожна серія
+    сортується як ланцюжок ListNode через sort_linked_list і записується
+    у тимчасовий файл як сирий типізований масив (array.tofile). Результат
+    видається потоковим K-way злиттям файлів серій.
+    
+    Кожна серія перевіряється на точне представлення типом масиву: значення,
+    які array спотворив би (рядки, цілі понад 2**53 у "d", NaN), дають
+    ValueError ще до видачі першого значення. Значення завжди
+    повертаються у вигляді, прочитаному з масиву, - і тоді, коли все
+    вмістилося в одну серію без диска.
+    """
+    
+    def __init__(self, memory_limit=64 * 2**20, typecode=None, algorithm="adaptive",
+                 temp_dir=None, block_items=8192):
+        """
+        Args:
+            memory_limit: орієнтовна пікова пам'ять на одну серію, байт
+            typecode: тип значень модуля array для формату файлів серій
+                (None - за першою серією: "q" для цілих, "d" для решти чисел)
+            algorithm: алгоритм сортування серій (див. sort_linked_list)
+            temp_dir: каталог для тимчасових файлів (None - системний)
+            block_items: кількість значень у блоці читання під час злиття
+        """
+        self.run_length = max(1, memory_limit // _NODE_BYTES)
+        self.typecode = typecode
+        self.algorithm = algorithm
+        self.temp_dir = temp_dir
+        self.block_items = block_items
+        self.stats = {}
+        self._read_seconds = 0.0
+        self._bytes_read = 0
+    
+    def _read_run(self, path, typecode):
+        """Генератор значень файлу серії, що читається блоками (час читання накопичується)"""
+        block_bytes = self.block_items * array(typecode).itemsize
+        with open(path, "rb") as file:
+            while True:
+                read_started = time.perf_counter()
+                data = file.read(block_bytes)
+                self._read_seconds += time.perf_counter() - read_started
+                self._bytes_read += len(data)
+                if not data:
+                    return
+                block = array(typecode)
+                block.frombytes(data)
+                yield from block
+    
+    def sort(self, iterable):
+        """
+        Сортує потік значень, повертаючи генератор відсортованих значень
+        
+        Після повного обходу генератора в self.stats доступна статистика:
+        кількість елементів і серій, обсяг записаних даних, час і пропускна
+        здатність. Швидкість диска рахується лише за час запису й читання
+        файлів серій, без сортування, злиття та роботи споживача.
+        """
+        started = time.perf_counter()
+        iterator = iter(iterable)
+        items = 0
+        bytes_written = 0
+        write_seconds = 0.0
+        typecode = self.typecode
+        self._read_seconds = 0.0
+        self._bytes_read = 0
+        
+        with tempfile.TemporaryDirectory(dir=self.temp_dir) as directory:
+            paths = []
+            
+            while True:
+                chunk = LinkedList.from_iterable(islice(iterator, self.run_length))
+                if not len(chunk):
+                    break
+                items += len(chunk)
+                head = sort_linked_list(chunk.head, self.algorithm)
+                values = list(_iter_chain_values(head))
+                chunk = head = None
+                
+                packed = _lossless_array(values, typecode)
+                if packed is None:
+                    raise ValueError(f"Значення серії {len(paths or ())} не представляються точно "
+                                     f"масивом array типу {typecode or 'q/d'!r}; "
+                                     f"зовнішнє сортування підтримує лише числа цього типу")
+                typecode = packed.typecode
+                values = None
+                
+                if not paths and len(packed) < self.run_length:
+                    # Усе вмістилося в одну серію - диск не потрібен
+                    paths = None
+                    break
+                
+                path = os.path.join(directory, f"run_{len(paths):06d}.bin")
+                write_started = time.perf_counter()
+                with open(path, "wb") as file:
+                    packed.tofile(file)
+                    bytes_written += file.tell()
+                write_seconds += time.perf_counter() - write_started
+                paths.append(path)
+                packed = None
+            
+            spilled = time.perf_counter()
+            
+            if paths is None:
+                yield from packed
+            else:
+                yield from heapq.merge(*(self._read_run(path, typecode) for path in paths))
+            
+            finished = time.perf_counter()
+        
+        total = finished - started
+        io_seconds = write_seconds + self._read_seconds
+        io_bytes = bytes_written + self._bytes_read
+        self.stats = {
+            "items": items,
+            "typecode": typecode,
+            "runs": len(paths) if paths is not None else 1,
+            "bytes_written": bytes_written,
+            "bytes_read": self._bytes_read,
+            "spill_seconds": spilled - started,
+            "merge_seconds": finished - spilled,
+            "write_seconds": write_seconds,
+            "read_seconds": self._read_seconds,
+            "items_per_second": items / total if total else 0.0,
+            "disk_mb_per_second": io_bytes / 2**20 / io_seconds if io_seconds else 0.0,
+        }
+
+
+def external_sort(iterable, memory_limit=64 * 2**20, typecode=None, algorithm="adaptive",
+                  temp_dir=None):
+    """
+    Зовнішнє сортування потоку значень (див. ExternalSorter)
+    
+    Returns:
+        генератор відсортованих значень
+    """
+    sorter = ExternalSorter(memory_limit, typecode, algorithm, temp_dir)
+    return sorter.sort(iterable)
+
+
+# Мінімальна довжина списку, з якої вигідно сортувати в кількох процесах
+PARALLEL_SORT_THRESHOLD = 50_000
+
+
+def _sort_segment_order(payload):
+    """
+    Сортує сегмент у робочому процесі
+    
+    Сегмент передається як байти типізованого масиву значень, а
+    повертається стабільний порядок індексів (теж байтами), тож між
+    процесами не пересилаються графи вузлів. Процесу потрібен лише
+    порядок, а не ланцюжок, тому він сортує індекси вбудованим sorted
+    (стабільним), що в рази швидше за сортування списку на чистому Python.
+    """
+    typecode, data = payload
+    values = array(typecode)
+    values.frombytes(data)
+    return array("q", sorted(range(len(values)), key=values.__getitem__)).tobytes()
+
+
+def _lossless_array(values, typecode=None):
+    """
+    Масив array зі значень, якщо він представляє їх точно, інакше None
+    
+    Без typecode тип обирається за даними: "q" для цілих, "d" для решти
+    чисел. Значення, що не вміщуються в тип або втрачають точність
+    (наприклад, цілі понад 2**53 у "d"), дають None.
+    """
+    if typecode is None:
+        typecode = "q" if all(type(value) is int for value in values) else "d"
+    try:
+        packed = array(typecode, values)
+    except (TypeError, OverflowError, ValueError):
+        return None
+    # NaN не дорівнює собі, тож такі дані теж ідуть у послідовне сортування
+    return packed if packed.tolist() == values else None
+
+
+def parallel_sort_linked_list(head, workers=None, typecode=None, algorithm="merge",
+                              threshold=PARALLEL_SORT_THRESHOLD):
+    """
+    Паралельне сортування однозв'язного списку в пулі процесів
+    
+    Ланцюжок ділиться на сегменти, індекси значень кожного сегмента
+    сортуються в окремому процесі, після чого вихідні вузли перев'язуються у
+    знайденому порядку, а відсортовані сегменти зливаються
+    merge_k_sorted_lists. Обидва кроки стабільні, тому результат збігається
+    з послідовним sort_linked_list (ті самі вузли в тому самому порядку).
+    
+    Args:
+        head: початок списку (ListNode)
+        workers: кількість процесів (None - кількість ядер)
+        typecode: тип значень модуля array (None - визначається за даними);
+                  якщо дані не представляються ним точно (рядки, цілі понад
+                  2**53 для "d" тощо), список сортується послідовно
+        algorithm: алгоритм послідовного сортування для коротких списків і
+                   даних, що не пакуються в масив (див. sort_linked_list)
+        threshold: коротші списки сортуються в поточному процесі
+    
+    Returns:
+        нова голова відсортованого списку
+    """
+    workers = workers or os.cpu_count() or 1
+    nodes = []
+    node = head
+    while node:
+        nodes.append(node)
+        node = node.next
+    
+    if workers < 2 or len(nodes) < max(threshold, 2):
+        return sort_linked_list(head, algorithm)
+    
+    # Процеси сортують копії значень, тож копія має бути точною - інакше
+    # порядок у процесах розійдеться з порівнянням справжніх значень при злитті
+    packed = _lossless_array([node.data for node in nodes], typecode)
+    if packed is None:
+        return sort_linked_list(head, algorithm)
+    
+    segment_length = -(-len(nodes) // workers)
+    segments = [nodes[start:start + segment_length]
+                for start in range(0, len(nodes), segment_length)]
+    payloads = [(packed.typecode, packed[start:start + segment_length].tobytes())
+                for start in range(0, len(nodes), segment_length)]
+    
+    with ProcessPoolExecutor(max_workers=len(segments)) as executor:
+        orders = list(executor.map(_sort_segment_order, payloads))
+    
+    # Перев'язуємо вихідні вузли кожного сегмента у відсортованому порядку
+    heads = []
+    for segment, data in zip(segments, orders):
+        order = array("q")
+        order.frombytes(data)
+        dummy = ListNode()
+        tail = dummy
+        for index in order:
+            tail.next = segment[index]
+            tail = tail.next
+        tail.next = None
+        heads.append(dummy.next)
+    
+    return merge_k_sorted_lists(heads)
+
+
+def benchmark_parallel_sort(size=4 * PARALLEL_SORT_THRESHOLD, workers=None, repeat=3, seed=0):
+    """
+    Порівнює parallel_sort_linked_list з послідовним sort_linked_list
+    
+    Args:
+        size: довжина списку (має перевищувати PARALLEL_SORT_THRESHOLD)
+        workers: кількість процесів (None - кількість ядер)
+        repeat: кількість повторів (береться найкращий час)
+        seed: зерно генератора випадкових даних
+    
+    Returns:
+        словник з часом обох сортувань і прискоренням
+    """
+    rng = random.Random(seed)
+    data = [rng.random() for _ in range(size)]
+    expected = sorted(data)
+    workers = workers or os.cpu_count() or 1
+    timings = {"serial": float("inf"), "parallel": float("inf")}
+    
+    for _ in range(repeat):
+        for name in timings:
+            head = LinkedList.from_list(data).head
+            started = time.perf_counter()
+            if name == "serial":
+                head = sort_linked_list(head)
+            else:
+                head = parallel_sort_linked_list(head, workers)
+            timings[name] = min(timings[name], time.perf_counter() - started)
+            assert list(_iter_chain_values(head)) == expected
+    
+    speedup = timings["serial"] / timings["parallel"] if timings["parallel"] else 0.0
+    print(f"n={size:,}, процесів: {workers}: послідовно {timings['serial']:.3f}с, "
+          f"паралельно {timings['parallel']:.3f}с (прискорення x{speedup:.2f})")
+    return {"size": size, "workers": workers, "serial_seconds": timings["serial"],
+            "parallel_seconds": timings["parallel"], "speedup": speedup}
+
+
+class _ExpressNode:
+    """Вузол експрес-смуги скіп-списку, що вказує на вузол базового ланцюжка"""
+    
+    __slots__ = ("node", "next", "down")
+    
+    def __init__(self, node, next_express=None, down=None):
+        self.node = node
+        self.next = next_express
+        self.down = down
+
+
+class SkipLinkedList:
+    """
+    Відсортований однозв'язний список з індексом скіп-списку
+    
+    Значення зберігаються у звичайному ланцюжку ListNode (head), над яким
+    будуються ймовірнісні експрес-смуги. Пошук, вставка, видалення та
+    запити діапазону працюють за очікуваний O(log n). Ланцюжок head завжди
+    відсортований і сумісний з merge_sorted_lists; рівні значення
+    зберігають порядок вставки.
+    """
+    
+    MAX_LEVEL = 32
+    
+    def __init__(self, probability=0.5, seed=None):
+        """
+        Args:
+            probability: імовірність підняти вузол на наступну смугу
+            seed: зерно генератора висот (для відтворюваності)
+        """
+        self.probability = probability
+        self._random = random.Random(seed)
+        self._clear()
+    
+    def _clear(self):
+        self._base = ListNode()  # фіктивна голова базового ланцюжка
+        self._lanes = []  # фіктивні голови смуг, знизу вгору
+        self._length = 0
+    
+    @property
+    def head(self):
+        """Перший вузол відсортованого базового ланцюжка"""
+        return self._base.next
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        return _iter_chain_values(self._base.next)
+    
+    def __contains__(self, value):
+        return self.find(value) is not None
+    
+    def _random_height(self):
+        """Випадкова кількість експрес-смуг для нового вузла (геометричний розподіл)"""
+        height = 0
+        while height < self.MAX_LEVEL and self._random.random() < self.probability:
+            height += 1
+        return height
+    
+    def _add_lane(self):
+        """Додає нову верхню смугу з фіктивною головою"""
+        down = self._lanes[-1] if self._lanes else None
+        self._lanes.append(_ExpressNode(self._base, None, down))
+    
+    def _predecessors(self, value, inclusive):
+        """
+        Знаходить попередників value на кожній смузі та в базовому ланцюжку
+        
+        Args:
+            inclusive: True - останній вузол зі значенням <= value,
+                       False - останній вузол зі значенням < value
+        
+        Returns:
+            кортеж (попередники на смугах знизу вгору, попередник у ланцюжку)
+        """
+        if inclusive:
+            def before(data):
+                return data <= value
+        else:
+            def before(data):
+                return data < value
+        
+        update = [None] * len(self._lanes)
+        express = self._lanes[-1] if self._lanes else None
+        for level in reversed(range(len(self._lanes))):
+            while express.next and before(express.next.node.data):
+                express = express.next
+            update[level] = express
+            if level:
+                express = express.down
+        
+        node = express.node if express else self._base
+        while node.next and before(node.next.data):
+            node = node.next
+        return update, node
+    
+    def find(self, value):
+        """Повертає перший вузол зі значенням value або None"""
+        _, node = self._predecessors(value, inclusive=False)
+        node = node.next
+        return node if node and node.data == value else None
+    
+    def insert(self, value):
+        """Вставляє значення, зберігаючи порядок (після рівних значень)"""
+        update, prev = self._predecessors(value, inclusive=True)
+        new_node = ListNode(value)
+        new_node.next = prev.next
+        prev.next = new_node
+        self._length += 1
+        
+        height = self._random_height()
+        while len(self._lanes) < height:
+            self._add_lane()
+            update.append(self._lanes[-1])
+        
+        down = None
+        for level in range(height):
+            express = _ExpressNode(new_node, update[level].next, down)
+            update[level].next = express
+            down = express
+        return new_node
+    
+    def delete(self, value):
+        """
+        Видаляє перше входження значення
+        
+        Returns:
+            True, якщо значення було знайдено та видалено
+        """
+        update, prev = self._predecessors(value, inclusive=False)
+        target = prev.next
+        if not target or target.data != value:
+            return False
+        
+        for express in update:
+            if express.next and express.next.node is target:
+                express.next = express.next.next
+        while self._lanes and self._lanes[-1].next is None:
+            self._lanes.pop()
+        
+        prev.next = target.next
+        target.next = None
+        self._length -= 1
+        return True
+    
+    def range_query(self, low, high):
+        """
+        Ліниво повертає значення v, для яких low <= v <= high
+        
+        Початок діапазону знаходиться за O(log n), далі - обхід ланцюжка.
+        """
+        _, node = self._predecessors(low, inclusive=False)
+        node = node.next
+        while node and node.data <= high:
+            yield node.data
+            node = node.next
+    
+    def _rebuild(self, head):
+        """Будує експрес-смуги над відсортованим ланцюжком за O(n)"""
+        self._clear()
+        self._base.next = head
+        last = []  # останній експрес-вузол на кожній смузі
+        node = head
+        while node:
+            self._length += 1
+            height = self._random_height()
+            while len(self._lanes) < height:
+                self._add_lane()
+                last.append(self._lanes[-1])
+            down = None
+            for level in range(height):
+                express = _ExpressNode(node, None, down)
+                last[level].next = express
+                last[level] = express
+                down = express
+            node = node.next
+    
+    def merge(self, other):
+        """
+        Зливає інший відсортований ланцюжок у цей список через merge_sorted_lists
+        
+        Args:
+            other: SkipLinkedList (стає порожнім), LinkedList або голова ListNode
+        
+        Індекс перебудовується за O(n + m).
+        """
+        if other is self:
+            raise ValueError("Неможливо злити список сам із собою")
+        if isinstance(other, (SkipLinkedList, LinkedList)):
+            other_head = other.head
+            if isinstance(other, SkipLinkedList):
+                other._clear()
+            else:
+                other.head = None
+        else:
+            other_head = other
+        self._rebuild(merge_sorted_lists(self.head, other_head))
+    
+    @classmethod
+    def from_sorted_chain(cls, head, probability=0.5, seed=None):
+        """Створює список з уже відсортованого ланцюжка ListNode за O(n)"""
+        skip_list = cls(probability, seed)
+        skip_list._rebuild(head)
+        return skip_list
+    
+    @classmethod
+    def from_iterable(cls, iterable, probability=0.5, seed=None):
+        """Створює список з довільних значень (сортування + побудова індексу)"""
+        head = sort_linked_list(LinkedList.from_iterable(iterable).head)
+        return cls.from_sorted_chain(head, probability, seed)
+
+
+class _UnrolledNode:
+    """Вузол розгорнутого списку: невеликий масив елементів і посилання на наступний"""
+    
+    __slots__ = ("items", "next")
+    
+    def __init__(self, items=None):
+        self.items = items if items is not None else []
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    Розгорнутий однозв'язний список
+    
+    Кожен вузол зберігає до capacity елементів у Python list, тому обхід
+    переходить за посиланням лише раз на capacity елементів, а більшість
+    роботи виконується всередині C-реалізації list. Семантика операцій
+    така сама, як у LinkedList та функцій модуля: сортування і злиття
+    стабільні.
+    """
+    
+    def __init__(self, capacity=64):
+        if capacity < 1:
+            raise ValueError("Місткість вузла має бути додатною")
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self._length = 0
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        node = self.head
+        while node:
+            yield from node.items
+            node = node.next
+    
+    def _append_node(self, items):
+        """Додає вузол з готовим масивом елементів у кінець ланцюжка"""
+        node = _UnrolledNode(items)
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self._length += len(items)
+    
+    def append(self, data):
+        """Додає новий елемент в кінець списку"""
+        if self.tail and len(self.tail.items) < self.capacity:
+            self.tail.items.append(data)
+            self._length += 1
+        else:
+            self._append_node([data])
+    
+    def prepend(self, data):
+        """Додає новий елемент на початок списку"""
+        if self.head and len(self.head.items) < self.capacity:
+            self.head.items.insert(0, data)
+        else:
+            node = _UnrolledNode([data])
+            node.next = self.head
+            self.head = node
+            if not self.tail:
+                self.tail = node
+        self._length += 1
+    
+    def extend(self, iterable):
+        """Додає елементи в кінець списку, заповнюючи вузли повністю"""
+        iterator = iter(iterable)
+        if self.tail:
+            room = self.capacity - len(self.tail.items)
+            block = list(islice(iterator, room))
+            self.tail.items.extend(block)
+            self._length += len(block)
+        while True:
+            block = list(islice(iterator, self.capacity))
+            if not block:
+                return
+            self._append_node(block)
+    
+    def _reset(self, iterable):
+        """Замінює вміст списку значеннями iterable, щільно пакуючи вузли"""
+        self.head = self.tail = None
+        self._length = 0
+        self.extend(iterable)
+    
+    def reverse(self):
+        """Реверсує список на місці: ланцюжок вузлів і масив кожного вузла"""
+        self.tail = self.head
+        self.head = reverse_linked_list(self.head)
+        node = self.head
+        while node:
+            node.items.reverse()
+            node = node.next
+    
+    def sort(self):
+        """
+        Стабільно сортує список
+        
+        Масив кожного вузла сортується вбудованим list.sort, після чого
+        вузли зливаються стабільним K-way злиттям у щільно заповнені вузли.
+        """
+        blocks = []
+        node = self.head
+        while node:
+            node.items.sort()
+            blocks.append(node.items)
+            node = node.next
+        self._reset(heapq.merge(*blocks))
+    
+    def merge(self, other):
+        """
+        Зливає інший відсортований розгорнутий список у цей
+        
+        Як і в merge_sorted_lists, рівні елементи цього списку йдуть першими.
+        Після злиття other стає порожнім.
+        """
+        if other is self:
+            raise ValueError("Неможливо злити список сам із собою")
+        merged = list(heapq.merge(self, other))
+        other.head = other.tail = None
+        other._length = 0
+        self._reset(merged)
+    
+    def display(self):
+        """Виводить всі елементи списку"""
+        return " -> ".join(map(str, self)) + " -> None"
+    
+    def to_list(self):
+        """Конвертує список в Python list"""
+        return list(self)
+    
+    @classmethod
+    def from_iterable(cls, iterable, capacity=64):
+        """Створює список з довільного ітерованого об'єкта"""
+        unrolled = cls(capacity)
+        unrolled.extend(iterable)
+        return unrolled
+    
+    @classmethod
+    def from_list(cls, data_list, capacity=64):
+        """Створює список з Python list"""
+        return cls.from_iterable(data_list, capacity)
+
+
+def _best_time(function, repeat):
+    """Найкращий час виконання function з repeat запусків, секунди"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def benchmark_unrolled_list(sizes=(1_000, 100_000, 1_000_000), capacity=64, repeat=3, seed=0):
+    """
+    Порівнює швидкість обходу та сортування LinkedList і UnrolledLinkedList
+    
+    Args:
+        sizes: розміри списків
+        capacity: місткість вузла розгорнутого списку
+        repeat: кількість повторів (береться найкращий час)
+        seed: зерно генератора випадкових даних
+    
+    Returns:
+        список словників з часом і пропускною здатністю (елементів/с)
+    """
+    rng = random.Random(seed)
+    results = []
+    
+    for size in sizes:
+        data = [rng.random() for _ in range(size)]
+        
+        def sort_plain():
+            sort_linked_list(LinkedList.from_list(data).head)
+        
+        def sort_unrolled():
+            UnrolledLinkedList.from_list(data, capacity).sort()
+        
+        plain = LinkedList.from_list(data)
+        unrolled = UnrolledLinkedList.from_list(data, capacity)
+        timings = {
+            "linked_traversal": _best_time(lambda: sum(plain), repeat),
+            "unrolled_traversal": _best_time(lambda: sum(unrolled), repeat),
+            "linked_sort": _best_time(sort_plain, repeat),
+            "unrolled_sort": _best_time(sort_unrolled, repeat),
+        }
+        
+        row = {"size": size}
+        for name, seconds in timings.items():
+            row[f"{name}_seconds"] = seconds
+            row[f"{name}_items_per_second"] = size / seconds if seconds else 0.0
+        results.append(row)
+        
+        print(f"n={size:>9,}: обхід {timings['linked_traversal']:.4f}с / {timings['unrolled_traversal']:.4f}с, "
+              f"сортування {timings['linked_sort']:.4f}с / {timings['unrolled_sort']:.4f}с "
+              f"(LinkedList / UnrolledLinkedList)")
+    
+    return results
+
+
+class _KeyOnCompare:
+    """Значення, що обчислює ключ під час кожного порівняння (для порівняння в бенчмарку)"""
+    
+    __slots__ = ("value", "key")
+    
+    def __init__(self, value, key):
+        self.value = value
+        self.key = key
+    
+    def __lt__(self, other):
+        return self.key(self.value) < self.key(other.value)
+    
+    def __le__(self, other):
+        return self.key(self.value) <= self.key(other.value)
+    
+    def __ge__(self, other):
+        return self.key(self.value) >= self.key(other.value)
+
+
+def benchmark_key_evaluations(size=10_000, algorithm="merge", seed=0):
+    """
+    Рахує, скільки обчислень ключа заощаджує кешування ключа у вузлах
+    
+    Той самий список записів сортується двічі: з key= (ключ обчислюється
+    один раз на вузол) і з ключем, що обчислюється при кожному порівнянні.
+    
+    Returns:
+        словник з кількістю обчислень ключа, часом і заощадженими викликами
+    """
+    rng = random.Random(seed)
+    records = [{"id": index, "score": rng.random()} for index in range(size)]
+    calls = 0
+    
+    def key(record):
+        nonlocal calls
+        calls += 1
+        return record["score"]
+    
+    started = time.perf_counter()
+    sort_linked_list(LinkedList.from_list(records).head, algorithm, key=key)
+    cached_seconds = time.perf_counter() - started
+    cached_calls, calls = calls, 0
+    
+    wrapped = LinkedList.from_iterable(_KeyOnCompare(record, key) for record in records)
+    started = time.perf_counter()
+    sort_linked_list(wrapped.head, algorithm)
+    per_compare_seconds = time.perf_counter() - started
+    
+    report = {
+        "size": size,
+        "algorithm": algorithm,
+        "cached_key_calls": cached_calls,
+        "per_comparison_key_calls": calls,
+        "saved_key_calls": calls - cached_calls,
+        "cached_seconds": cached_seconds,
+        "per_comparison_seconds": per_compare_seconds,
+    }
+    print(f"n={size:,}: обчислень ключа {cached_calls:,} з кешем проти {calls:,} "
+          f"при кожному порівнянні (заощаджено {calls - cached_calls:,})")
+    return report
+
+
+# Формат знімка: заголовок, масив значень, необов'язковий масив порядку ("q")
+_SNAPSHOT_MAGIC = b"LLSN"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<4sBBcxQ")  # magic, версія, прапорці, typecode, кількість
+_FLAG_HAS_ORDER = 1
+_FLAG_BIG_ENDIAN = 2
+_SNAPSHOT_BLOCK_ITEMS = 8192  # значень на блок під час лінивого обходу знімка
+
+
+def save_snapshot(source, path, typecode="d", with_order=False):
+    """
+    Зберігає список у компактний бінарний файл за один лінійний прохід
+    
+    Args:
+        source: LinkedList, ArrayLinkedList, голова ListNode або ітерований об'єкт
+        path: шлях до файлу
+        typecode: тип значень модуля array
+        with_order: зберегти також стабільний відсортований порядок індексів
+    
+    Returns:
+        кількість збережених елементів
+    """
+    if source is None or isinstance(source, ListNode):
+        source = _iter_chain_values(source)
+    values = array(typecode, source)
+    count = len(values)
+    
+    flags = _FLAG_BIG_ENDIAN if sys.byteorder == "big" else 0
+    if with_order:
+        flags |= _FLAG_HAS_ORDER
+    
+    with open(path, "wb") as file:
+        file.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, flags,
+                                         typecode.encode("ascii"), count))
+        values.tofile(file)
+        if with_order:
+            array("q", sorted(range(count), key=values.__getitem__)).tofile(file)
+    return count
+
+
+class LinkedListSnapshot:
+    """
+    Знімок списку, відображений у пам'ять через mmap
+    
+    Значення читаються напряму з файлу без копіювання; вузли ListNode
+    створюються лише за потреби (to_linked_list), а to_array_linked_list
+    будує компактний список одним копіюванням буфера.
+    """
+    
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header(path)
+        except BaseException:
+            self._mmap.close()
+            raise
+    
+    def _read_header(self, path):
+        """Розбирає заголовок і перевіряє, що файл містить усі заявлені дані"""
+        if len(self._mmap) < _SNAPSHOT_HEADER.size:
+            raise ValueError(f"Файл {path} коротший за заголовок знімка")
+        magic, version, flags, typecode, count = _SNAPSHOT_HEADER.unpack_from(self._mmap)
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            raise ValueError(f"Файл {path} не є знімком списку")
+        if bool(flags & _FLAG_BIG_ENDIAN) != (sys.byteorder == "big"):
+            raise ValueError("Знімок збережено з іншим порядком байтів")
+        
+        self.typecode = typecode.decode("ascii")
+        self.count = count
+        self.has_order = bool(flags & _FLAG_HAS_ORDER)
+        self._values_offset = _SNAPSHOT_HEADER.size
+        self._order_offset = self._values_offset + count * array(self.typecode).itemsize
+        
+        expected = self._order_offset + (count * array("q").itemsize if self.has_order else 0)
+        if len(self._mmap) < expected:
+            raise ValueError(f"Файл {path} обрізаний: заголовок вимагає {expected} байт, "
+                             f"а у файлі {len(self._mmap)}")
+    
+    def __len__(self):
+        return self.count
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Закриває відображення файлу"""
+        self._mmap.close()
+    
+    def _view(self, offset, typecode):
+        """memoryview масиву з count елементів, що починається з offset"""
+        size = self.count * array(typecode).itemsize
+        return memoryview(self._mmap)[offset:offset + size].cast(typecode)
+    
+    def _values(self):
+        return self._view(self._values_offset, self.typecode)
+    
+    def _order(self):
+        if not self.has_order:
+            raise ValueError("Знімок не містить відсортованого порядку")
+        return self._view(self._order_offset, "q")
+    
+    def __iter__(self):
+        """
+        Ліниво обходить значення у збереженому порядку
+        
+        Значення копіюються блоками, і memoryview звільняється до першого
+        yield, тому незавершений обхід не заважає close().
+        """
+        for start in range(0, self.count, _SNAPSHOT_BLOCK_ITEMS):
+            with self._values() as values:
+                block = values[start:start + _SNAPSHOT_BLOCK_ITEMS].tolist()
+            yield from block
+    
+    def iter_sorted(self):
+        """Ліниво обходить значення у відсортованому порядку (потрібен with_order)"""
+        for start in range(0, self.count, _SNAPSHOT_BLOCK_ITEMS):
+            with self._values() as values, self._order() as order:
+                block = [values[index] for index in order[start:start + _SNAPSHOT_BLOCK_ITEMS]]
+            yield from block
+    
+    def to_linked_list(self, ordered=False):
+        """Будує LinkedList з вузлами ListNode (у відсортованому порядку, якщо ordered)"""
+        return LinkedList.from_iterable(self.iter_sorted() if ordered else iter(self))
+    
+    def to_array_linked_list(self, ordered=False):
+        """
+        Будує ArrayLinkedList з буфера файлу за O(n) без створення об'єктів вузлів
+        
+        Якщо ordered, індексні посилання проставляються за збереженим
+        порядком, тож список одразу відсортований.
+        """
+        pool = ArrayNodePool(self.typecode, self.count)
+        with self._values() as values:
+            pool.values[:] = array(self.typecode, values.tobytes())
+        pool.size = self.count
+        
+        array_list = ArrayLinkedList(pool=pool)
+        if not self.count:
+            return array_list
+        
+        if ordered:
+            with self._order() as view:
+                order = array("q", view.tobytes())
+            pool.next[:] = array("q", [NIL]) * self.count
+            for current, following in zip(order, islice(order, 1, None)):
+                pool.next[current] = following
+            array_list.head, array_list.tail = order[0], order[-1]
+        else:
+            pool.next[:] = array("q", range(1, self.count))
+            pool.next.append(NIL)
+            array_list.head, array_list.tail = 0, self.count - 1
+        array_list.length = self.count
+        return array_list
+
+
+def load_snapshot(path):
+    """Відкриває знімок списку, збережений save_snapshot (див. LinkedListSnapshot)"""
+    return LinkedListSnapshot(path)
+
+
+class ConcurrentLinkedList:
+    """
+    Потокобезпечний однозв'язний список-черга для схеми виробник/споживач
+    
+    Двоблокувальна черга Майкла-Скотта: голова та хвіст мають окремі
+    блокування, тому додавання в кінець і вилучення з початку (обидва
+    O(1)) не заважають одне одному. drain() від'єднує весь ланцюжок
+    за O(1) і повертає його як звичайний LinkedList, напр. для сортування.
+    """
+    
+    def __init__(self):
+        self._dummy = ListNode()  # фіктивна голова: перший елемент - _dummy.next
+        self._tail = self._dummy
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._head_lock)
+        self._waiters = 0
+        self._enqueued = 0  # змінюється під _tail_lock
+        self._dequeued = 0  # змінюється під _head_lock
+    
+    def __len__(self):
+        """Приблизна довжина (точна, якщо інші потоки не змінюють список)"""
+        return self._enqueued - self._dequeued
+    
+    def _link(self, head, tail, count):
+        """Приєднує готовий ланцюжок у кінець під блокуванням хвоста"""
+        with self._tail_lock:
+            self._tail.next = head
+            self._tail = tail
+            self._enqueued += count
+        
+        # Будимо споживача, лише якщо хтось чекає (без блокування голови)
+        if self._waiters:
+            with self._not_empty:
+                self._not_empty.notify()
+    
+    def put(self, data):
+        """Додає елемент у кінець списку"""
+        node = ListNode(data)
+        self._link(node, node, 1)
+    
+    def put_many(self, iterable):
+        """Додає кілька елементів одним приєднанням ланцюжка"""
+        chain = LinkedList.from_iterable(iterable)
+        if len(chain):
+            self._link(chain._head, chain._tail, len(chain))
+    
+    def _wait_not_empty(self, block, timeout):
+        """Чекає появи елементів; викликається під блокуванням голови"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Лічильник збільшується до перевірки, тож сповіщення не загубиться
+        self._waiters += 1
+        try:
+            while self._dummy.next is None:
+                if not block:
+                    raise queue.Empty
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._not_empty.wait(remaining)
+        finally:
+            self._waiters -= 1
+    
+    def get(self, block=True, timeout=None):
+        """
+        Вилучає елемент з початку списку
+        
+        Raises:
+            queue.Empty: список порожній (block=False) або минув timeout
+        """
+        with self._not_empty:
+            self._wait_not_empty(block, timeout)
+            node = self._dummy.next
+            # Вилучений вузол стає новою фіктивною головою
+            self._dummy = node
+            data, node.data = node.data, None
+            self._dequeued += 1
+            return data
+    
+    def drain(self, block=True, timeout=None):
+        """
+        Від'єднує весь ланцюжок за O(1)
+        
+        Returns:
+            LinkedList з усіма накопиченими елементами
+        
+        Raises:
+            queue.Empty: список порожній (block=False) або минув timeout
+        """
+        with self._not_empty:
+            self._wait_not_empty(block, timeout)
+            with self._tail_lock:
+                head, tail = self._dummy.next, self._tail
+                count = self._enqueued - self._dequeued
+                self._dummy.next = None
+                self._tail = self._dummy
+                self._dequeued = self._enqueued
+        
+        drained = LinkedList()
+        drained._head, drained._tail, drained._length = head, tail, count
+        return drained
+
+
+def _run_producers(concurrent_list, producers, items_per_producer):
+    """
+    Запускає потоки-виробники та споживача, що зливає список пакетами
+    
+    Returns:
+        кортеж (усі отримані елементи у порядку отримання, тривалість у секундах)
+    """
+    total = producers * items_per_producer
+    received = []
+    
+    def produce(producer):
+        for number in range(items_per_producer):
+            concurrent_list.put((producer, number))
+    
+    def consume():
+        while len(received) < total:
+            received.extend(concurrent_list.drain(timeout=5))
+    
+    threads = [threading.Thread(target=produce, args=(producer,)) for producer in range(producers)]
+    consumer = threading.Thread(target=consume)
+    started = time.perf_counter()
+    consumer.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    consumer.join()
+    return received, time.perf_counter() - started
+
+
+def stress_test_concurrent_list(producers=8, items_per_producer=5_000):
+    """
+    Стрес-тест ConcurrentLinkedList
+    
+    Перевіряє, що кожен елемент отримано рівно один раз і що елементи
+    кожного виробника йдуть у порядку додавання.
+    """
+    concurrent_list = ConcurrentLinkedList()
+    received, _ = _run_producers(concurrent_list, producers, items_per_producer)
+    
+    assert len(received) == producers * items_per_producer, "Втрачено або задубльовано елементи"
+    last_seen = [-1] * producers
+    for producer, number in received:
+        assert number == last_seen[producer] + 1, "Порушено порядок елементів виробника"
+        last_seen[producer] = number
+    assert len(concurrent_list) == 0
+    return True
+
+
+def benchmark_concurrent_list(producer_counts=(1, 4, 16), items_per_producer=50_000):
+    """
+    Вимірює пропускну здатність ConcurrentLinkedList для різної кількості виробників
+    
+    Returns:
+        список словників з кількістю потоків, часом і елементами за секунду
+    """
+    results = []
+    for producers in producer_counts:
+        received, seconds = _run_producers(ConcurrentLinkedList(), producers, items_per_producer)
+        rate = len(received) / seconds if seconds else 0.0
+        results.append({"producers": producers, "items": len(received),
+                        "seconds": seconds, "items_per_second": rate})
+        print(f"Виробників: {producers:>2}, елементів: {len(received):,}, {rate:,.0f} ел./с")
+    return results
+
+
+# Дескриптор слота next базового вузла (для вузлів, що рахують перезаписи)
+_NODE_NEXT_SLOT = ListNode.next
+
+# Стан інструментування зберігається в контекстних змінних, а не в глобальних
+# змінних модуля: інші потоки (наприклад, ConcurrentLinkedList.put) його не бачать
+_profile_counters = contextvars.ContextVar("profile_counters", default=None)
+_profiling = contextvars.ContextVar("profiling", default=False)
+_active_instrumentation = contextvars.ContextVar("active_instrumentation", default=None)
+
+
+class _CountingNode(ListNode):
+    """Вузол, що рахує створення та перезаписи посилання next (лише для інструментування)"""
+    
+    __slots__ = ()
+    
+    def __init__(self, data=None):
+        counters = _profile_counters.get()
+        if counters is not None:
+            counters["node_allocations"] += 1
+        self.data = data
+        _NODE_NEXT_SLOT.__set__(self, None)
+    
+    @property
+    def next(self):
+        return _NODE_NEXT_SLOT.__get__(self)
+    
+    @next.setter
+    def next(self, node):
+        counters = _profile_counters.get()
+        if counters is not None:
+            counters["pointer_rewrites"] += 1
+        _NODE_NEXT_SLOT.__set__(self, node)
+
+
+# Клас службових вузлів (dummy), які створюють алгоритми; у вимірюваному виклику - _CountingNode
+_node_factory = contextvars.ContextVar("node_factory", default=ListNode)
+
+
+def _new_node(data=None):
+    """Службовий вузол алгоритму: ListNode або, під час вимірювання, _CountingNode"""
+    return _node_factory.get()(data)
+
+
+class _CountingValue:
+    """Обгортка значення або ключа, що рахує порівняння"""
+    
+    __slots__ = ("value", "counters")
+    
+    def __init__(self, value, counters):
+        self.value = value
+        self.counters = counters
+    
+    def _compare(self, other, operator):
+        self.counters["comparisons"] += 1
+        if isinstance(other, _CountingValue):
+            other = other.value
+        return operator(self.value, other)
+    
+    def __lt__(self, other):
+        return self._compare(other, lambda left, right: left < right)
+    
+    def __le__(self, other):
+        return self._compare(other, lambda left, right: left <= right)
+    
+    def __gt__(self, other):
+        return self._compare(other, lambda left, right: left > right)
+    
+    def __ge__(self, other):
+        return self._compare(other, lambda left, right: left >= right)
+    
+    def __eq__(self, other):
+        return self._compare(other, lambda left, right: left == right)
+    
+    __hash__ = None
+
+
+def _counting_copy(node, counters, wrap_values):
+    """
+    Копія ланцюжка з вузлів _CountingNode
+    
+    Якщо wrap_values, значення обгортаються в _CountingValue - лише для
+    викликів без key, де функція порівнює значення напряму і власний код
+    користувача їх не бачить. З key значення лишаються незмінними, а
+    порівняння рахуються через обгорнутий ключ.
+    """
+    dummy = _CountingNode()
+    tail = dummy
+    while node:
+        copy = _CountingNode(_CountingValue(node.data, counters) if wrap_values else node.data)
+        _NODE_NEXT_SLOT.__set__(tail, copy)
+        tail = copy
+        node = node.next
+    return _NODE_NEXT_SLOT.__get__(dummy)
+
+
+# Аргументи, які лічильний прогін може безпечно використати повторно без копіювання
+_PROFILE_SCALAR_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _counting_argument(value, counters, wrap_values, copies):
+    """
+    Аргумент для лічильного прогону profile_list_call
+    
+    ListNode і LinkedList (також усередині list/tuple) замінюються копіями з
+    вузлів _CountingNode, щоб лічильний прогін не змінював вузли викликача.
+    copies - словник id(голова) -> (копія, довжина): той самий ланцюжок,
+    переданий кілька разів, копіюється один раз. Скаляри та функції (key)
+    передаються як є; для решти значень (ітератори, інші контейнери)
+    безпечна копія невідома, тому кидається TypeError.
+    """
+    if isinstance(value, ListNode):
+        if id(value) not in copies:
+            copies[id(value)] = (_counting_copy(value, counters, wrap_values),
+                                 _chain_tail_and_length(value)[1])
+        return copies[id(value)][0]
+    if isinstance(value, LinkedList):
+        linked_list = LinkedList()
+        if value.head is not None:
+            linked_list.head = _counting_argument(value.head, counters, wrap_values, copies)
+        return linked_list
+    if type(value) in (list, tuple):
+        return type(value)(_counting_argument(item, counters, wrap_values, copies) for item in value)
+    if isinstance(value, _PROFILE_SCALAR_TYPES) or callable(value):
+        return value
+    raise TypeError(f"profile_list_call не може безпечно скопіювати аргумент типу "
+                    f"{type(value).__name__}; передайте ListNode, LinkedList або їх list/tuple")
+
+
+def profile_list_call(function, *args, **kwargs):
+    """
+    Виконує функцію над ланцюжками ListNode і збирає статистику виклику
+    
+    Функція виконується ДВІЧІ, і обидва прогони детерміновані для тих самих
+    даних:
+    1. лічильний прогін на копіях аргументів-ListNode та LinkedList (зокрема
+       іменованих і вкладених у list/tuple) з вузлів _CountingNode -
+       рахує порівняння, перезаписи посилань і створення вузлів. Без key
+       значення копії обгортаються лічильниками порівнянь; з key значення
+       не змінюються, а рахуються порівняння ключів (key обгортається).
+       Прогін іде першим, тож якщо він падає, вузли викликача не змінені;
+    2. справжній прогін на вихідних даних - його результат повертається, а
+       час і пікова пам'ять (tracemalloc) вимірюються саме на ньому, без
+       накладних витрат лічильників.
+    Стан вимірювання зберігається в контекстних змінних, тож інші потоки
+    його не бачать.
+    
+    Returns:
+        кортеж (результат виклику на вихідних даних, словник-звіт)
+    
+    Raises:
+        TypeError: аргумент не можна безпечно скопіювати (напр. ітератор);
+            функція тоді не виконується жодного разу
+    """
+    counters = {"comparisons": 0, "pointer_rewrites": 0, "node_allocations": 0}
+    key = kwargs.get("key")
+    counted_kwargs = dict(kwargs)
+    if key is not None:
+        counted_kwargs["key"] = lambda data: _CountingValue(key(data), counters)
+    copies = {}
+    counted_args = [_counting_argument(arg, counters, key is None, copies) for arg in args]
+    for name, value in kwargs.items():
+        if name != "key":
+            counted_kwargs[name] = _counting_argument(value, counters, key is None, copies)
+    nodes = sum(length for _, length in copies.values())
+    
+    profiling_token = _profiling.set(True)
+    try:
+        # Вузли, створені всередині функції (dummy тощо), теж мають рахуватися
+        factory_token = _node_factory.set(_CountingNode)
+        counters_token = _profile_counters.set(counters)
+        try:
+            function(*counted_args, **counted_kwargs)
+        finally:
+            _profile_counters.reset(counters_token)
+            _node_factory.reset(factory_token)
+        
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            started = time.perf_counter()
+            result = function(*args, **kwargs)
+            seconds = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+    finally:
+        _profiling.reset(profiling_token)
+    
+    report = {
+        "function": getattr(function, "__name__", repr(function)),
+        "nodes": nodes,
+        **counters,
+        "peak_memory_bytes": peak,
+        "seconds": seconds,
+    }
+    return result, report
+
+
+# Підмінені функції модуля: ім'я -> [оригінал, кількість активних ListInstrumentation]
+_instrumented_functions = {}
+_instrumentation_lock = threading.Lock()
+
+
+def _instrumentation_dispatcher(name, original):
+    """Обгортка функції модуля, що вимірює виклик лише в контексті активного ListInstrumentation"""
+    def instrumented(*args, **kwargs):
+        instrumentation = _active_instrumentation.get()
+        if instrumentation is None or _profiling.get() or name not in instrumentation.functions:
+            return original(*args, **kwargs)
+        result, report = profile_list_call(original, *args, **kwargs)
+        instrumentation.reports.append(report)
+        return result
+    
+    instrumented.__name__ = original.__name__
+    instrumented.__doc__ = original.__doc__
+    return instrumented
+
+
+class ListInstrumentation:
+    """
+    Вмикає інструментування функцій модуля на час блоку with
+    
+    Поки блок активний, функції модуля (за замовчуванням
+    reverse_linked_list, insertion_sort_linked_list та merge_sorted_lists)
+    підміняються обгортками, що викликають profile_list_call і зберігають
+    звіти. Вимірюються лише виклики з того самого потоку (контексту), що
+    увійшов у блок; в інших потоках обгортка одразу викликає оригінал.
+    Після виходу з останнього активного блоку функції відновлюються, тож
+    поза блоком накладних витрат немає. Виклики мають іти через модуль
+    (task1.merge_sorted_lists(...)), бо імпортовані раніше імена не
+    підміняються. Вкладені виклики всередині вимірюваного виклику не
+    вимірюються окремо.
+    """
+    
+    DEFAULT_FUNCTIONS = ("reverse_linked_list", "insertion_sort_linked_list", "merge_sorted_lists")
+    
+    def __init__(self, functions=DEFAULT_FUNCTIONS):
+        self.functions = tuple(functions)
+        self.reports = []
+        self._token = None
+    
+    def __enter__(self):
+        if self._token is not None:
+            raise RuntimeError("ListInstrumentation вже активний")
+        module = globals()
+        with _instrumentation_lock:
+            for name in self.functions:
+                if name not in _instrumented_functions:
+                    original = module[name]
+                    module[name] = _instrumentation_dispatcher(name, original)
+                    _instrumented_functions[name] = [original, 0]
+                _instrumented_functions[name][1] += 1
+        self._token = _active_instrumentation.set(self)
+        return self
+    
+    def __exit__(self, *exc_info):
+        _active_instrumentation.reset(self._token)
+        self._token = None
+        module = globals()
+        with _instrumentation_lock:
+            for name in self.functions:
+                entry = _instrumented_functions[name]
+                entry[1] -= 1
+                if entry[1] == 0:
+                    module[name] = entry[0]
+                    del _instrumented_functions[name]
+    
+    def report(self):
+        """Звіт: список викликів і підсумки по кожній функції"""
+        totals = {}
+        for call in self.reports:
+            total = totals.setdefault(call["function"], {
+                "calls": 0, "nodes": 0, "comparisons": 0, "pointer_rewrites": 0,
+                "node_allocations": 0, "peak_memory_bytes": 0, "seconds": 0.0,
+            })
+            total["calls"] += 1
+            for field in ("nodes", "comparisons", "pointer_rewrites", "node_allocations", "seconds"):
+                total[field] += call[field]
+            total["peak_memory_bytes"] = max(total["peak_memory_bytes"], call["peak_memory_bytes"])
+        return {"calls": list(self.reports), "totals": totals}
+    
+    def to_json(self, indent=2):
+        """Звіт у форматі JSON"""
+        return json.dumps(self.report(), indent=indent, ensure_ascii=False)
+
+
+class _PersistentNode:
+    """Вузол незмінного списку; після публікації у PersistentList не змінюється"""
+    
+    __slots__ = ("data", "next")
+    
+    def __init__(self, data, next_node=None):
+        self.data = data
+        self.next = next_node
+
+
+class PersistentList:
+    """
+    Незмінний (персистентний) однозв'язний список зі спільною структурою
+    
+    Операції повертають нові списки, що використовують вузли старих:
+    prepend і tail - O(1) без копіювання, snapshot - O(1), бо список
+    ніколи не змінюється. Для швидкої пакетної побудови є PersistentListBuilder.
+    """
+    
+    __slots__ = ("_head", "_length")
+    
+    def __init__(self, head=None, length=0):
+        self._head = head
+        self._length = length
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        return _iter_chain_values(self._head)
+    
+    def __bool__(self):
+        return self._head is not None
+    
+    def __eq__(self, other):
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+    
+    __hash__ = None
+    
+    @property
+    def first(self):
+        """Перший елемент списку"""
+        if self._head is None:
+            raise IndexError("Список порожній")
+        return self._head.data
+    
+    def prepend(self, data):
+        """Новий список з data на початку; поточний список повністю спільний (O(1))"""
+        return PersistentList(_PersistentNode(data, self._head), self._length + 1)
+    
+    def tail(self):
+        """Список без першого елемента - спільний суфікс (O(1))"""
+        if self._head is None:
+            raise IndexError("Список порожній")
+        return PersistentList(self._head.next, self._length - 1)
+    
+    def snapshot(self):
+        """Знімок списку - той самий об'єкт, бо список незмінний (O(1))"""
+        return self
+    
+    def merge(self, other):
+        """
+        Зливає два відсортовані списки у новий відсортований список
+        
+        Вузли створюються лише для префікса до моменту, коли один зі
+        списків вичерпано; залишок іншого списку використовується спільно
+        без копіювання. Злиття стабільне: при рівності першим іде елемент self.
+        """
+        builder = PersistentListBuilder()
+        left, right = self._head, other._head
+        while left and right:
+            if left.data <= right.data:
+                builder.append(left.data)
+                left = left.next
+            else:
+                builder.append(right.data)
+                right = right.next
+        
+        rest = left if left else right
+        rest_length = len(self) + len(other) - len(builder)
+        return builder.persistent(rest, rest_length)
+    
+    def display(self):
+        """Виводить всі елементи списку"""
+        return " -> ".join(map(str, self)) + " -> None"
+    
+    def to_linked_list(self):
+        """Змінювана копія у вигляді LinkedList"""
+        return LinkedList.from_iterable(self)
+    
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Створює список за один прохід через PersistentListBuilder"""
+        builder = PersistentListBuilder()
+        builder.extend(iterable)
+        return builder.persistent()
+    
+    @classmethod
+    def builder(cls):
+        """Перехідний (змінюваний) будівельник для пакетної побудови"""
+        return PersistentListBuilder()
+
+
+class PersistentListBuilder:
+    """
+    Перехідний режим для швидкої побудови PersistentList
+    
+    append додає в кінець за O(1), змінюючи ще не опубліковані вузли.
+    persistent() публікує ланцюжок як незмінний список; після цього
+    будівельник починає новий порожній ланцюжок.
+    """
+    
+    def __init__(self):
+        self._head = None
+        self._tail = None
+        self._length = 0
+    
+    def __len__(self):
+        return self._length
+    
+    def append(self, data):
+        """Додає елемент у кінець ланцюжка, що будується"""
+        node = _PersistentNode(data)
+        if self._tail:
+            self._tail.next = node
+        else:
+            self._head = node
+        self._tail = node
+        self._length += 1
+        return self
+    
+    def extend(self, iterable):
+        """Додає всі елементи ітерованого об'єкта"""
+        for data in iterable:
+            self.append(data)
+        return self
+    
+    def persistent(self, rest=None, rest_length=0):
+        """
+        Публікує побудований ланцюжок як PersistentList
+        
+        Args:
+            rest: голова вже опублікованого ланцюжка, що стане спільним хвостом
+            rest_length: довжина rest
+        """
+        if self._tail:
+            self._tail.next = rest
+            result = PersistentList(self._head, self._length + rest_length)
+        else:
+            result = PersistentList(rest, rest_length)
+        self._head = self._tail = None
+        self._length = 0
+        return result
+
+
+BENCHMARK_SHAPES = ("random", "sorted", "reversed", "nearly_sorted")
+
+
+def _benchmark_data(shape, size, rng):
+    """Вхідні дані заданої форми: випадкові, відсортовані, обернені або майже відсортовані"""
+    data = [rng.random() for _ in range(size)]
+    if shape == "random":
+        return data
+    data.sort()
+    if shape == "sorted":
+        return data
+    if shape == "reversed":
+        data.reverse()
+        return data
+    if shape == "nearly_sorted":
+        # ~1% "запізнілих" елементів, переставлених у випадкові місця
+        for _ in range(max(1, size // 100)):
+            data.insert(rng.randrange(size), data.pop(rng.randrange(size)))
+        return data
+    raise ValueError(f"Невідома форма даних: {shape}")
+
+
+def _benchmark_cases(data):
+    """Пари (назва операції, функція підготовки, вимірювана операція) для одних даних"""
+    half = len(data) // 2
+    first, second = sorted(data[:half]), sorted(data[half:])
+    
+    return (
+        ("from_list", lambda: (data,), LinkedList.from_list),
+        ("reverse_linked_list", lambda: (LinkedList.from_list(data).head,), reverse_linked_list),
+        ("insertion_sort_linked_list", lambda: (LinkedList.from_list(data).head,),
+         insertion_sort_linked_list),
+        ("merge_sorted_lists",
+         lambda: (LinkedList.from_list(first).head, LinkedList.from_list(second).head),
+         merge_sorted_lists),
+    )
+
+
+def _measure(setup, operation, repeat, warmup):
+    """Час кожного з repeat запусків після warmup розігрівальних; підготовка не вимірюється"""
+    for _ in range(warmup):
+        operation(*setup())
+    timings = []
+    for _ in range(repeat):
+        args = setup()
+        started = time.perf_counter()
+        operation(*args)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _fit_exponent(sizes, seconds):
+    """Показник k у t ~ n^k за методом найменших квадратів у логарифмічному масштабі"""
+    points = [(math.log(size), math.log(value)) for size, value in zip(sizes, seconds)
+              if size > 0 and value > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def run_linked_list_benchmarks(sizes=(500, 1_000, 2_000, 4_000), shapes=BENCHMARK_SHAPES,
+                               repeat=5, warmup=1, seed=0):
+    """
+    Набір бенчмарків для функцій однозв'язного списку
+    
+    Для кожної операції, форми даних і розміру виконується warmup
+    розігрівальних і repeat вимірюваних запусків; за медіанами часу
+    оцінюється емпіричний показник складності.
+    
+    Returns:
+        словник {"results": [рядки вимірювань], "exponents": [показники]}
+    """
+    rng = random.Random(seed)
+    results = []
+    
+    for shape in shapes:
+        for size in sizes:
+            data = _benchmark_data(shape, size, rng)
+            for operation, setup, function in _benchmark_cases(data):
+                timings = sorted(_measure(setup, function, repeat, warmup))
+                results.append({
+                    "operation": operation,
+                    "shape": shape,
+                    "size": size,
+                    "repeat": repeat,
+                    "min_seconds": timings[0],
+                    "median_seconds": timings[len(timings) // 2],
+                    "max_seconds": timings[-1],
+                })
+    
+    exponents = []
+    groups = {}
+    for row in results:
+        groups.setdefault((row["operation"], row["shape"]), []).append(row)
+    for (operation, shape), rows in groups.items():
+        exponent = _fit_exponent([row["size"] for row in rows],
+                                 [row["median_seconds"] for row in rows])
+        exponents.append({"operation": operation, "shape": shape, "exponent": exponent})
+    
+    return {"results": results, "exponents": exponents}
+
+
+def write_benchmark_results(report, csv_path=None, json_path=None):
+    """
+    Записує результати run_linked_list_benchmarks у CSV та/або JSON
+    
+    CSV містить рядки вимірювань, JSON - увесь звіт разом із показниками
+    складності, тож файли різних версій можна порівнювати.
+    """
+    if csv_path:
+        with open(csv_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=list(report["results"][0]))
+            writer.writeheader()
+            writer.writerows(report["results"])
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+
+
+def test_linked_list_functionality():
+    """Тестування всіх функцій"""
+    print("=== Тестування однозв'язного списку ===\n")
+    
+    # Тест 1: Створення списку та додавання елементів
+    print("1. Створення списку та додавання елементів:")
+    ll = LinkedList()
+    ll.append(3)
+    ll.append(1)
+    ll.append(4)
+    ll.append(2)
+    ll.prepend(0)
+    print(f"Список: {ll.display()}")
+    print()
+    
+    # Тест 2: Реверсування списку
+    print("2. Реверсування списку:")
+    print(f"Оригінальний список: {ll.display()}")
+    reversed_head = reverse_linked_list(ll.head)
+    
+    # Створюємо новий список для відображення реверсованого
+    reversed_ll = LinkedList()
+    reversed_ll.head = reversed_head
+    print(f"Реверсований список: {reversed_ll.display()}")
+    print()
+    
+    # Тест 3: Сортування вставками
+    print("3. Сортування вставками:")
+    ll2 = LinkedList.from_list([5, 2, 8, 1, 9, 3])
+    print(f"До сортування: {ll2.display()}")
+    sorted_head = insertion_sort_linked_list(ll2.head)
+    
+    sorted_ll = LinkedList()
+    sorted_ll.head = sorted_head
+    print(f"Після сортування: {sorted_ll.display()}")
+    print()
+    
+    # Тест 4: Об'єднання двох відсортованих списків
+    print("4. Об'єднання двох відсортованих списків:")
+    list1 = LinkedList.from_list([1, 3, 5, 7])
+    list2 = LinkedList.from_list([2, 4, 6, 8])
+    print(f"Список 1: {list1.display()}")
+    print(f"Список 2: {list2.display()}")
+    
+    merged_head = merge_sorted_lists(list1.head, list2.head)
+    merged_ll = LinkedList()
+    merged_ll.head = merged_head
+    print(f"Об'єднаний список: {merged_ll.display()}")
+    print()
+    
+    # Тест 5: Об'єднання списків різної довжини
+    print("5. Об'єднання списків різної довжини:")
+    list3 = LinkedList.from_list([1, 5, 9])
+    list4 = LinkedList.from_list([2, 3, 6, 7, 10, 11])
+    print(f"Список 3: {list3.display()}")
+    print(f"Список 4: {list4.display()}")
+    
+    merged_head2 = merge_sorted_lists(list3.head, list4.head)
+    merged_ll2 = LinkedList()
+    merged_ll2.head = merged_head2
+    print(f"Об'єднаний список: {merged_ll2.display()}")
+    print()
+    
+    # Тест 6: Сортування злиттям знизу вгору
+    print("6. Сортування злиттям знизу вгору:")
+    ll3 = LinkedList.from_list([7, 3, 9, 1, 5, 8, 2, 6, 4, 0])
+    print(f"До сортування: {ll3.display()}")
+    sorted_ll3 = LinkedList()
+    sorted_ll3.head = sort_linked_list(ll3.head, algorithm="merge", run_size=2)
+    print(f"Після сортування: {sorted_ll3.display()}")
+    assert sorted_ll3.to_list() == list(range(10))
+    print()
+    
+    # Тест 7: Адаптивне сортування майже відсортованого списку
+    print("7. Адаптивне сортування природними серіями:")
+    ll4 = LinkedList.from_list([1, 2, 3, 9, 8, 7, 4, 5, 6, 0])
+    print(f"До сортування: {ll4.display()}")
+    sorted_ll4 = LinkedList()
+    sorted_ll4.head = sort_linked_list(ll4.head, algorithm="adaptive", run_size=1)
+    print(f"Після сортування: {sorted_ll4.display()}")
+    assert sorted_ll4.to_list() == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    print()
+    
+    # Тест 8: Об'єднання K відсортованих списків
+    print("8. Об'єднання K відсортованих списків:")
+    shards = [LinkedList.from_list(values) for values in ([1, 4, 7], [2, 5, 8], [0, 3, 6, 9])]
+    for number, shard in enumerate(shards, 1):
+        print(f"Список {number}: {shard.display()}")
+    lazy_values = list(iter_merge_sorted_lists([shard.head for shard in shards]))
+    merged_ll3 = LinkedList()
+    merged_ll3.head = merge_k_sorted_lists([shard.head for shard in shards])
+    print(f"Об'єднаний список: {merged_ll3.display()}")
+    assert merged_ll3.to_list() == lazy_values == list(range(10))
+    print()
+    
+    # Тест 9: Побудова з генератора та зшивання списків
+    print("9. Побудова з генератора та зшивання списків:")
+    ll5 = LinkedList.from_iterable(value * value for value in range(1, 4))
+    ll5.extend(LinkedList.from_list([10, 11]))
+    ll5.extend_left(LinkedList.from_list([-1, 0]))
+    print(f"Список: {ll5.display()}, довжина: {len(ll5)}")
+    assert list(ll5) == [-1, 0, 1, 4, 9, 10, 11] and len(ll5) == 7
+    print(f"У зворотному порядку: {list(reversed(ll5))}")
+    print(f"Вікно [2:5]: {list(ll5.window(2, 5))}")
+    assert list(reversed(ll5)) == [11, 10, 9, 4, 1, 0, -1] and ll5[0] == -1 and ll5[-1] == 11
+    # поки триває reversed(), інші обходи та зміни списку заборонені
+    for misuse in (lambda: list(zip(ll5, reversed(ll5))),
+                   lambda: [ll5[0] for _ in reversed(ll5)],
+                   lambda: [ll5.append(0) for _ in reversed(ll5)]):
+        try:
+            misuse()
+            raise AssertionError("очікувався RuntimeError")
+        except RuntimeError:
+            pass
+    assert list(ll5) == [-1, 0, 1, 4, 9, 10, 11] and len(ll5) == 7
+    print()
+    
+    # Тест 10: Компактний список на типізованих масивах
+    print("10. Компактний список на типізованих масивах:")
+    compact = ArrayLinkedList.from_nodes(LinkedList.from_list([5, 2, 8, 1, 9, 3]), typecode="q")
+    compact.sort()
+    print(f"Відсортований: {compact.display()}")
+    compact.reverse()
+    print(f"Реверсований: {compact.display()}")
+    assert list(compact.to_linked_list()) == [9, 8, 5, 3, 2, 1]
+    try:
+        compact.merge(compact)
+        raise AssertionError("очікувався ValueError")
+    except ValueError:
+        pass
+    print()
+    
+    # Тест 11: Зовнішнє сортування з обмеженням пам'яті
+    print("11. Зовнішнє сортування з обмеженням пам'яті:")
+    stream = [(value * 7919) % 1000 for value in range(1000)]
+    sorter = ExternalSorter(memory_limit=100 * _NODE_BYTES, typecode="q")
+    result = list(sorter.sort(stream))
+    assert result == sorted(stream)
+    stats = sorter.stats
+    assert stats["bytes_read"] == stats["bytes_written"] > 0
+    # типи значень не залежать від того, чи знадобився диск
+    small_limit = 100 * _NODE_BYTES
+    assert list(external_sort([3, 1, 2], small_limit)) == [1, 2, 3]
+    assert list(external_sort([3, 1, 2], small_limit, typecode="d")) == [1.0, 2.0, 3.0]
+    big = [2 ** 60 + value for value in stream]
+    assert list(external_sort(big, small_limit)) == sorted(big)
+    for data, typecode in ((big, "d"), ([str(value) for value in stream], None), (["b", "a"], None)):
+        try:
+            list(external_sort(data, small_limit, typecode=typecode))
+            raise AssertionError("очікувався ValueError")
+        except ValueError:
+            pass
+    print(f"Елементів: {stats['items']}, серій: {stats['runs']}, "
+          f"швидкість: {stats['items_per_second']:,.0f} ел./с, диск: {stats['disk_mb_per_second']:.2f} МБ/с")
+    print()
+    
+    # Тест 12: Паралельне сортування в пулі процесів
+    print("12. Паралельне сортування в пулі процесів:")
+    values = [(value * 7919) % 1000 for value in range(2000)]
+    parallel_ll = LinkedList()
+    parallel_ll.head = parallel_sort_linked_list(LinkedList.from_list(values).head,
+                                                 workers=2, typecode="q", threshold=1000)
+    assert list(parallel_ll) == sorted(values)
+    # Дані, які array не представляє точно, сортуються послідовно, а не хибно
+    big = [2 ** 60 + value for value in values]
+    words = [str(value) for value in values]
+    for data, typecode in ((big, None), (big, "d"), (words, None)):
+        parallel_ll.head = parallel_sort_linked_list(LinkedList.from_list(data).head, workers=2,
+                                                     typecode=typecode, threshold=1000)
+        assert list(parallel_ll) == sorted(data)
+    print(f"Відсортовано {len(parallel_ll)} елементів у 2 процесах")
+    print()
+    
+    # Тест 13: Відсортований список з індексом скіп-списку
+    print("13. Відсортований список з індексом скіп-списку:")
+    skip_list = SkipLinkedList.from_iterable([5, 2, 8, 1, 9, 3], seed=42)
+    skip_list.insert(4)
+    skip_list.delete(8)
+    print(f"Список: {' -> '.join(map(str, skip_list))} -> None")
+    print(f"Діапазон [2, 5]: {list(skip_list.range_query(2, 5))}")
+    assert list(skip_list) == [1, 2, 3, 4, 5, 9] and 4 in skip_list and 8 not in skip_list
+    print()
+    
+    # Тест 14: Розгорнутий список
+    print("14. Розгорнутий список (по 4 елементи у вузлі):")
+    unrolled = UnrolledLinkedList.from_list([5, 2, 8, 1, 9, 3, 7], capacity=4)
+    unrolled.sort()
+    unrolled.merge(UnrolledLinkedList.from_list([0, 4, 6], capacity=4))
+    print(f"Відсортований та об'єднаний: {unrolled.display()}")
+    unrolled.reverse()
+    unrolled.prepend(10)
+    print(f"Реверсований з новою головою: {unrolled.display()}")
+    assert unrolled.to_list() == [10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+    try:
+        unrolled.merge(unrolled)
+        raise AssertionError("очікувався ValueError")
+    except ValueError:
+        pass
+    assert len(unrolled) == 11
+    print()
+    
+    # Тест 15: Бінарний знімок списку з відображенням у пам'ять
+    print("15. Бінарний знімок списку:")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "list.snapshot")
+        save_snapshot(LinkedList.from_list([5, 2, 8, 1, 9, 3]), path, typecode="q", with_order=True)
+        with load_snapshot(path) as snapshot:
+            restored = snapshot.to_linked_list()
+            ordered = snapshot.to_array_linked_list(ordered=True)
+            print(f"Відновлений: {restored.display()}")
+            print(f"Відсортований за збереженим порядком: {ordered.display()}")
+            assert list(restored) == [5, 2, 8, 1, 9, 3] and list(ordered) == [1, 2, 3, 5, 8, 9]
+            assert list(snapshot.iter_sorted()) == [1, 2, 3, 5, 8, 9]
+            # незавершені обходи не тримають буфер - знімок закривається без BufferError
+            pending = iter(snapshot), snapshot.iter_sorted()
+            assert [next(iterator) for iterator in pending] == [5, 1]
+        # обрізаний файл або файл, коротший за заголовок, - ValueError, а не тихо менше значень
+        with open(path, "rb") as file:
+            content = file.read()
+        for size in (len(content) - 8, _SNAPSHOT_HEADER.size + 16, _SNAPSHOT_HEADER.size - 1):
+            with open(path, "wb") as file:
+                file.write(content[:size])
+            try:
+                load_snapshot(path)
+                raise AssertionError("очікувався ValueError")
+            except ValueError:
+                pass
+    print()
+    
+    # Тест 16: Сортування записів за ключем та за спаданням
+    print("16. Сортування записів за ключем та за спаданням:")
+    records = LinkedList.from_list([("b", 2), ("a", 3), ("c", 2), ("d", 1)])
+    by_score = LinkedList()
+    by_score.head = sort_linked_list(records.head, key=lambda record: record[1], reverse=True)
+    print(f"За спаданням оцінки: {by_score.display()}")
+    assert list(by_score) == [("a", 3), ("b", 2), ("c", 2), ("d", 1)]
+    benchmark_key_evaluations(1000)
+    print()
+    
+    # Тест 17: Потокобезпечний список
+    print("17. Потокобезпечний список (4 виробники, пакетне вилучення):")
+    assert stress_test_concurrent_list(producers=4, items_per_producer=1000)
+    print("✓ Усі елементи отримано рівно один раз у порядку додавання")
+    print()
+    
+    # Тест 18: Інструментування функцій списку
+    print("18. Інструментування функцій списку:")
+    with ListInstrumentation() as instrumentation:
+        sorted_head = insertion_sort_linked_list(LinkedList.from_list([5, 2, 8, 1, 9, 3]).head)
+        merge_sorted_lists(sorted_head, LinkedList.from_list([0, 4, 7]).head)
+    for name, total in instrumentation.report()["totals"].items():
+        print(f"{name}: порівнянь {total['comparisons']}, перезаписів посилань "
+              f"{total['pointer_rewrites']}, нових вузлів {total['node_allocations']}, "
+              f"пік пам'яті {total['peak_memory_bytes']} Б")
+    # key не бачить обгорток: рахуються порівняння ключів, значення не змінюються
+    with ListInstrumentation() as keyed:
+        records = merge_sorted_lists(LinkedList.from_list([(1, "a"), (3, "c")]).head,
+                                     LinkedList.from_list([(2, "b")]).head, key=lambda row: row[0])
+        negated = insertion_sort_linked_list(LinkedList.from_list([1, 3, 2]).head, key=lambda v: -v)
+        other_thread = threading.Thread(target=reverse_linked_list,
+                                        args=(LinkedList.from_list([1, 2]).head,))
+        other_thread.start()
+        other_thread.join()
+    assert list(_iter_chain_values(records)) == [(1, "a"), (2, "b"), (3, "c")]
+    assert list(_iter_chain_values(negated)) == [3, 2, 1]
+    assert [call["function"] for call in keyed.reports] == ["merge_sorted_lists", "insertion_sort_linked_list"]
+    assert keyed.reports[0]["comparisons"] == 2, "Виклик з іншого потоку не вимірюється"
+    # ланцюжки в списках та іменованих аргументах теж копіюються для лічильного прогону
+    shard_heads = [LinkedList.from_list(values).head for values in ([1, 4, 7], [2, 5, 8])]
+    merged_k, merged_k_report = profile_list_call(merge_k_sorted_lists, shard_heads)
+    assert list(_iter_chain_values(merged_k)) == [1, 2, 4, 5, 7, 8]
+    assert merged_k_report["nodes"] == 6 and merged_k_report["comparisons"] > 0
+    merged_kw, merged_kw_report = profile_list_call(merge_sorted_lists,
+                                                    head1=LinkedList.from_list([1, 3]).head,
+                                                    head2=LinkedList.from_list([2]).head)
+    assert list(_iter_chain_values(merged_kw)) == [1, 2, 3] and merged_kw_report["nodes"] == 3
+    with ListInstrumentation(functions=("merge_k_sorted_lists",)) as k_way:
+        merged_k = merge_k_sorted_lists([LinkedList.from_list(values).head
+                                         for values in ([3, 6], [1, 9])])
+    assert list(_iter_chain_values(merged_k)) == [1, 3, 6, 9] and k_way.reports[0]["nodes"] == 4
+    try:
+        profile_list_call(merge_k_sorted_lists, iter([LinkedList.from_list([1]).head]))
+        raise AssertionError("очікувався TypeError")
+    except TypeError:
+        pass
+    print()
+    
+    # Тест 19: Персистентний список зі спільною структурою
+    print("19. Персистентний список зі спільною структурою:")
+    base = PersistentList.from_iterable([3, 5, 9])
+    snapshot = base.snapshot()
+    extended = base.prepend(1)
+    merged = extended.merge(PersistentList.from_iterable([2, 4]))
+    print(f"Знімок: {snapshot.display()}")
+    print(f"Після prepend: {extended.display()}")
+    print(f"Після злиття: {merged.display()}")
+    assert list(snapshot) == [3, 5, 9] and extended.tail() == base
+    assert list(merged) == [1, 2, 3, 4, 5, 9] and len(merged) == 6
+    print()
+    
+    # Тест 20: Бенчмарк зі збереженням результатів
+    print("20. Бенчмарк функцій списку (малі розміри):")
+    report = run_linked_list_benchmarks(sizes=(100, 200, 400), shapes=("random", "sorted"),
+                                        repeat=3, warmup=1)
+    for row in report["exponents"]:
+        print(f"{row['operation']} ({row['shape']}): n^{row['exponent']:.2f}")
+    with tempfile.TemporaryDirectory() as directory:
+        write_benchmark_results(report, os.path.join(directory, "bench.csv"),
+                                os.path.join(directory, "bench.json"))
     print()
 
 
 if __name__ == "__main__":
-    test_linked_list_functionality()
+    if len(sys.argv) > 1 and sys.argv[1] == "suite":
+        prefix = sys.argv[2] if len(sys.argv) > 2 else "linked_list_benchmark"
+        write_benchmark_results(run_linked_list_benchmarks(), f"{prefix}.csv", f"{prefix}.json")
+    elif len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        benchmark_unrolled_list()
+        benchmark_key_evaluations()
+        benchmark_parallel_sort()
+        benchmark_concurrent_list()
+    else:
+        test_linked_list_functionality()
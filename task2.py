@@ -8,14 +8,58 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import List, Tuple
+import hashlib
+import itertools
+import json
+import os
+import struct
+import tempfile
+import time
+import tracemalloc
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 
 class PythagoreanTree:
     """Клас для створення фрактала дерево Піфагора"""
     
-    def __init__(self):
+    def __init__(self, branch_angle: float = np.pi / 4, ratio: float = 0.7,
+                 left_angle: Optional[float] = None, right_angle: Optional[float] = None,
+                 trunk: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 2.0)):
+        """
+        Args:
+            branch_angle: кут повороту дочірніх ліній (за замовчуванням 45 градусів)
+            ratio: коефіцієнт скорочення довжини, 0 < ratio < 1
+            left_angle, right_angle: окремі кути для лівої та правої ліній (None - branch_angle)
+            trunk: стовбур (x1, y1, x2, y2)
+        """
+        if not 0 < ratio < 1:
+            raise ValueError("Коефіцієнт скорочення має бути в межах (0, 1)")
+        x1, y1, x2, y2 = trunk
+        if x1 == x2 and y1 == y2:
+            raise ValueError("Стовбур має ненульову довжину")
+        
+        self.left_angle = branch_angle if left_angle is None else left_angle
+        self.right_angle = branch_angle if right_angle is None else right_angle
+        self.ratio = ratio
+        self.trunk = (float(x1), float(y1), float(x2), float(y2))
+        self.trunk_angle = float(np.arctan2(y2 - y1, x2 - x1))
+        self.trunk_length = float(np.hypot(x2 - x1, y2 - y1))
+        
         self.lines = []  # Зберігаємо координати ліній для візуалізації
+        self.segments = np.empty((0, 4))  # Результат векторизованої генерації (N, 4)
+        self.squares = np.empty((0, 4, 2))  # Квадрати класичного дерева Піфагора (N, 4, 2)
+    
+    def parameters(self) -> dict:
+        """Параметри дерева у вигляді, придатному для PythagoreanTree(**parameters)"""
+        return {"ratio": self.ratio, "left_angle": self.left_angle,
+                "right_angle": self.right_angle, "trunk": self.trunk}
         
     def draw_line(self, x1: float, y1: float, x2: float, y2: float) -> Tuple[float, float, float, float]:
         """
@@ -56,19 +100,16 @@ class PythagoreanTree:
         dy = y2 - y1
         length = np.sqrt(dx**2 + dy**2)
         
-        # Скорочуємо довжину для наступного рівня (коефіцієнт 0.7)
-        new_length = length * 0.7
-        
-        # Кут повороту для дочірніх ліній (45 градусів)
-        rotation_angle = np.pi / 4
+        # Скорочуємо довжину для наступного рівня (за замовчуванням 0.7)
+        new_length = length * self.ratio
         
-        # Ліва дочірня лінія
-        left_angle = angle - rotation_angle
+        # Ліва дочірня лінія (кути повороту за замовчуванням - 45 градусів)
+        left_angle = angle - self.left_angle
         left_x2 = x2 + new_length * np.cos(left_angle)
         left_y2 = y2 + new_length * np.sin(left_angle)
         
         # Права дочірня лінія
-        right_angle = angle + rotation_angle
+        right_angle = angle + self.right_angle
         right_x2 = x2 + new_length * np.cos(right_angle)
         right_y2 = y2 + new_length * np.sin(right_angle)
         
@@ -84,14 +125,727 @@ class PythagoreanTree:
             max_level: максимальний рівень рекурсії
         """
         # Початкова лінія (ствол дерева)
-        x1, y1 = 0, 0
-        x2, y2 = 0, 2
+        x1, y1, x2, y2 = self.trunk
         
         # Очищуємо попередні лінії
         self.lines = []
+        self.segments = np.empty((0, 4))
+        
+        # Починаємо рекурсію (за замовчуванням стовбур спрямований на 90 градусів вгору)
+        self.pythagorean_tree(x1, y1, x2, y2, 0, max_level, self.trunk_angle)
+    
+    def generate_levels(self, max_level: int = 5) -> List[np.ndarray]:
+        """
+        Векторизовано генерує дерево рівень за рівнем
+        
+        Кожен рівень обчислюється з попереднього однією серією операцій
+        NumPy над масивами кінців ліній і кутів, без рекурсії. Дочірні
+        лінії кожного рівня йдуть парами (ліва, права), тобто у порядку
+        обходу в ширину.
+        
+        Args:
+            max_level: максимальний рівень рекурсії
+        
+        Returns:
+            список масивів (2^level, 4) з координатами (x1, y1, x2, y2)
+        """
+        if max_level <= 0:
+            return []
+        
+        # Початкова лінія (ствол дерева)
+        return self._grow_levels(*self.trunk, self.trunk_angle, max_level)
+    
+    def _branch(self, x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                angle: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Дочірні лінії для масиву ліній: пари (ліва, права) для кожного батька
+        
+        Ті самі формули, що й у pythagorean_tree, але для всього масиву.
+        
+        Returns:
+            кортеж (x1, y1, x2, y2, angle) дочірніх ліній
+        """
+        dx = x2 - x1
+        dy = y2 - y1
+        new_length = np.repeat(np.sqrt(dx**2 + dy**2) * self.ratio, 2)
+        
+        child_angle = np.empty(2 * angle.size)
+        child_angle[0::2] = angle - self.left_angle
+        child_angle[1::2] = angle + self.right_angle
+        
+        child_x1 = np.repeat(x2, 2)
+        child_y1 = np.repeat(y2, 2)
+        child_x2 = child_x1 + new_length * np.cos(child_angle)
+        child_y2 = child_y1 + new_length * np.sin(child_angle)
+        return child_x1, child_y1, child_x2, child_y2, child_angle
+    
+    def _grow_levels(self, x1: float, y1: float, x2: float, y2: float,
+                     angle: float, depth: int) -> List[np.ndarray]:
+        """Рівні піддерева глибиною depth з коренем (x1, y1)-(x2, y2) у порядку обходу в ширину"""
+        x1, y1, x2, y2, angle = (np.full(1, value, dtype=float) for value in (x1, y1, x2, y2, angle))
+        
+        levels = []
+        for level in range(depth):
+            levels.append(np.column_stack((x1, y1, x2, y2)))
+            if level + 1 == depth:
+                break
+            x1, y1, x2, y2, angle = self._branch(x1, y1, x2, y2, angle)
+        return levels
+    
+    @staticmethod
+    def _preorder_positions(max_level: int) -> List[np.ndarray]:
+        """
+        Позиції ліній кожного рівня в порядку рекурсивного обходу (прямий обхід)
+        
+        Ліва дитина йде одразу після батька, права - після всього лівого
+        піддерева з 2^(max_level - level - 1) - 1 ліній.
+        """
+        positions = [np.zeros(1, dtype=np.int64)]
+        for level in range(1, max_level):
+            left_subtree = 2 ** (max_level - level) - 1
+            offsets = np.tile(np.array([1, 1 + left_subtree], dtype=np.int64), positions[-1].size)
+            positions.append(np.repeat(positions[-1], 2) + offsets)
+        return positions
+    
+    def create_tree_vectorized(self, max_level: int = 5) -> np.ndarray:
+        """
+        Створює дерево векторизовано, без рекурсії
+        
+        Лінії збираються в один масив (N, 4) у тому самому порядку, що й
+        self.lines після create_tree.
+        
+        Args:
+            max_level: максимальний рівень рекурсії
+        
+        Returns:
+            масив self.segments з координатами (x1, y1, x2, y2)
+        """
+        levels = self.generate_levels(max_level)
+        self.lines = []
+        self.segments = np.empty((2 ** max(max_level, 0) - 1, 4))
+        
+        for rows, positions in zip(levels, self._preorder_positions(max_level)):
+            self.segments[positions] = rows
+        return self.segments
+    
+    @staticmethod
+    def rotation_tables(max_level: int, left_angle: float = np.pi / 4, right_angle: float = np.pi / 4,
+                        ratio: float = 0.7, trunk_length: float = 2.0,
+                        trunk_angle: float = np.pi / 2) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Таблиці зсувів кінця лінії за глибиною та кількістю правих поворотів
+        
+        Кут лінії на глибині depth залежить лише від того, скільки разів шлях
+        повертав праворуч (rights), а довжина - лише від depth:
+        angle = trunk_angle - (depth - rights) * left_angle + rights * right_angle,
+        length = trunk_length * ratio^depth. Тому sqrt/cos/sin обчислюються
+        один раз на комірку таблиці, а не на кожну лінію.
+        
+        Args:
+            max_level: максимальний рівень рекурсії
+            left_angle, right_angle: кути повороту лівої та правої дочірніх ліній
+            ratio: коефіцієнт скорочення довжини
+            trunk_length, trunk_angle: довжина та кут стовбура
+        
+        Returns:
+            масиви (max_level, max_level) зсувів dx і dy; комірки rights > depth не використовуються
+        """
+        depth = np.arange(max_level)[:, None]
+        rights = np.arange(max_level)[None, :]
+        angle = trunk_angle - (depth - rights) * left_angle + rights * right_angle
+        length = trunk_length * ratio ** depth
+        return length * np.cos(angle), length * np.sin(angle)
+    
+    def create_tree_table(self, max_level: int = 5) -> np.ndarray:
+        """
+        Створює дерево з попередньо обчислених таблиць поворотів
+        
+        Кожен кінець дочірньої лінії - це кінець батьківської плюс зсув із
+        rotation_tables, тобто лише вибірка з таблиці та додавання, без
+        тригонометрії на лінію. Порядок ліній - як у create_tree; координати
+        збігаються з рекурсивними з точністю до похибки округлення.
+        
+        Args:
+            max_level: максимальний рівень рекурсії
+        
+        Returns:
+            масив self.segments з координатами (x1, y1, x2, y2)
+        """
+        self.lines = []
+        self.segments = np.empty((2 ** max(max_level, 0) - 1, 4))
+        if max_level <= 0:
+            return self.segments
+        
+        dx_table, dy_table = self.rotation_tables(max_level, self.left_angle, self.right_angle,
+                                                  self.ratio, self.trunk_length, self.trunk_angle)
+        x1, y1 = np.full(1, self.trunk[0]), np.full(1, self.trunk[1])
+        rights = np.zeros(1, dtype=np.int64)
+        turns = np.array([0, 1], dtype=np.int64)
+        
+        for level, positions in enumerate(self._preorder_positions(max_level)):
+            if level:
+                # Ліва дитина зберігає лічильник правих поворотів, права - збільшує
+                x1, y1 = np.repeat(x2, 2), np.repeat(y2, 2)
+                rights = np.repeat(rights, 2) + np.tile(turns, rights.size)
+            x2 = x1 + dx_table[level, rights]
+            y2 = y1 + dy_table[level, rights]
+            self.segments[positions] = np.column_stack((x1, y1, x2, y2))
+        return self.segments
+    
+    def iter_segment_chunks(self, max_level: int, chunk_size: int = 65536) -> Iterator[np.ndarray]:
+        """
+        Потоково генерує лінії дерева блоками фіксованого розміру
+        
+        Дерево обходиться в глибину з явним стеком замість рекурсії Python.
+        Піддерева, що вміщуються в один блок, генеруються векторизовано
+        цілком, тому пам'ять обмежена розміром блоку та глибиною дерева,
+        а не кількістю ліній. Порядок ліній - як у create_tree.
+        
+        Args:
+            max_level: максимальний рівень рекурсії
+            chunk_size: кількість ліній у блоці
+        
+        Yields:
+            масиви (chunk_size, 4); останній блок може бути коротшим
+        """
+        if chunk_size < 1:
+            raise ValueError("Розмір блоку має бути додатним")
+        if max_level <= 0:
+            return
+        
+        # Найглибше піддерево з 2^depth - 1 ліній, що вміщується в блок
+        block_depth = (chunk_size + 1).bit_length() - 1
+        positions_cache = {}
+        
+        buffer = np.empty((chunk_size, 4))
+        filled = 0
+        
+        # Елемент стеку: (x1, y1, x2, y2, angle, кількість рівнів, що лишилися)
+        stack = [self.trunk + (self.trunk_angle, max_level)]
+        while stack:
+            x1, y1, x2, y2, angle, depth = stack.pop()
+            
+            if depth <= block_depth:
+                if depth not in positions_cache:
+                    positions_cache[depth] = self._preorder_positions(depth)
+                rows = np.empty((2 ** depth - 1, 4))
+                for level_rows, positions in zip(self._grow_levels(x1, y1, x2, y2, angle, depth),
+                                                 positions_cache[depth]):
+                    rows[positions] = level_rows
+            else:
+                rows = np.array([[x1, y1, x2, y2]])
+                children = self._branch(*(np.full(1, value) for value in (x1, y1, x2, y2, angle)))
+                # Права дитина кладеться першою, щоб ліва оброблялась раніше
+                for index in (1, 0):
+                    stack.append(tuple(float(values[index]) for values in children) + (depth - 1,))
+            
+            start = 0
+            while start < len(rows):
+                taken = min(chunk_size - filled, len(rows) - start)
+                buffer[filled:filled + taken] = rows[start:start + taken]
+                filled += taken
+                start += taken
+                if filled == chunk_size:
+                    yield buffer
+                    buffer = np.empty((chunk_size, 4))
+                    filled = 0
+        
+        if filled:
+            yield buffer[:filled]
+    
+    def estimate_bounds(self, max_level: int, sample_level: int = 14) -> Tuple[float, float, float, float]:
+        """
+        Межі дерева (xmin, xmax, ymin, ymax) без генерації всіх ліній
+        
+        Точно обчислюються перші sample_level рівнів, а глибші рівні
+        враховуються запасом: будь-яка глибша точка лежить не далі за суму
+        довжин решти ліній, тобто геометричного ряду з коефіцієнтом ratio.
+        """
+        sampled = min(max_level, sample_level)
+        if sampled <= 0:
+            return (0.0, 0.0, 0.0, 0.0)
+        
+        points = np.concatenate(self.generate_levels(sampled)).reshape(-1, 2)
+        margin = 0.0
+        if max_level > sampled:
+            margin = self.trunk_length * self.ratio ** sampled / (1 - self.ratio)
+        xmin, ymin = points.min(axis=0) - margin
+        xmax, ymax = points.max(axis=0) + margin
+        return (float(xmin), float(xmax), float(ymin), float(ymax))
+    
+    @staticmethod
+    def _disk_hits_viewport(cx: np.ndarray, cy: np.ndarray, radius: np.ndarray,
+                            viewport: Tuple[float, float, float, float]) -> np.ndarray:
+        """Маска кругів (cx, cy, radius), що перетинають прямокутник (xmin, xmax, ymin, ymax)"""
+        xmin, xmax, ymin, ymax = viewport
+        dx = np.maximum(np.maximum(xmin - cx, cx - xmax), 0)
+        dy = np.maximum(np.maximum(ymin - cy, cy - ymax), 0)
+        return dx * dx + dy * dy <= radius * radius
+    
+    def lod_level(self, pixel_size: float, min_pixels: float = 1.0) -> int:
+        """
+        Кількість рівнів, лінії яких не коротші за min_pixels пікселів
+        
+        Довжина лінії на рівні level - trunk_length * ratio^level, тож межа
+        деталізації однакова для всього рівня.
+        """
+        threshold = pixel_size * min_pixels
+        if threshold <= 0:
+            raise ValueError("Розмір пікселя має бути додатним")
+        if threshold > self.trunk_length:
+            return 1
+        return int(np.floor(np.log(threshold / self.trunk_length) / np.log(self.ratio))) + 1
+    
+    def generate_visible_levels(self, viewport: Tuple[float, float, float, float], pixel_size: float,
+                                max_level: Optional[int] = None,
+                                min_pixels: float = 1.0) -> List[np.ndarray]:
+        """
+        Векторизовано генерує лише видиму частину дерева з потрібною деталізацією
+        
+        Усі нащадки лінії лежать у крузі з центром у її кінці та радіусом
+        length * ratio / (1 - ratio) (сума довжин решти гілок). Піддерево
+        відкидається, якщо цей круг не перетинає viewport; лінія малюється,
+        якщо її власний круг (центр - середина, радіус - половина довжини)
+        перетинає viewport. Рівні з лініями коротшими за min_pixels пікселів
+        не генеруються, тож час пропорційний видимій деталізації, а не
+        розміру всього дерева.
+        
+        Args:
+            viewport: видима область (xmin, xmax, ymin, ymax)
+            pixel_size: розмір пікселя в одиницях площини
+            max_level: додаткове обмеження глибини (None - лише деталізація)
+            min_pixels: мінімальна довжина лінії в пікселях
+        
+        Returns:
+            список масивів (k, 4) видимих ліній кожного рівня
+        """
+        depth = self.lod_level(pixel_size, min_pixels)
+        if max_level is not None:
+            depth = min(depth, max_level)
+        
+        x1, y1, x2, y2, angle = (np.full(1, value, dtype=float) for value in self.trunk + (self.trunk_angle,))
+        reach = self.ratio / (1 - self.ratio)
+        
+        levels = []
+        for level in range(depth):
+            length = np.hypot(x2 - x1, y2 - y1)
+            visible = self._disk_hits_viewport((x1 + x2) / 2, (y1 + y2) / 2, length / 2, viewport)
+            levels.append(np.column_stack((x1[visible], y1[visible], x2[visible], y2[visible])))
+            if level + 1 == depth:
+                break
+            
+            # Розгалужуємо лише ті лінії, чиї нащадки можуть потрапити у viewport
+            grow = self._disk_hits_viewport(x2, y2, length * reach, viewport)
+            if not grow.any():
+                break
+            x1, y1, x2, y2, angle = self._branch(x1[grow], y1[grow], x2[grow], y2[grow], angle[grow])
+        return levels
+    
+    def create_tree_viewport(self, viewport: Tuple[float, float, float, float], pixel_size: float,
+                             max_level: Optional[int] = None, min_pixels: float = 1.0) -> np.ndarray:
+        """
+        Створює лише видиму частину дерева (див. generate_visible_levels)
+        
+        Returns:
+            масив self.segments видимих ліній, упорядкованих за рівнями
+        """
+        levels = self.generate_visible_levels(viewport, pixel_size, max_level, min_pixels)
+        self.lines = []
+        self.segments = np.concatenate(levels) if levels else np.empty((0, 4))
+        return self.segments
+    
+    def get_segments(self) -> np.ndarray:
+        """Лінії дерева як масив (N, 4) - з self.lines або self.segments"""
+        if self.lines:
+            return np.asarray(self.lines, dtype=float)
+        return self.segments
+    
+    @classmethod
+    def segment_levels(cls, count: int) -> np.ndarray:
+        """
+        Рівень кожної лінії для дерева з count = 2^max_level - 1 ліній
+        
+        Порядок ліній - як у create_tree (рекурсивний прямий обхід).
+        """
+        max_level = int(count + 1).bit_length() - 1
+        if 2 ** max_level - 1 != count:
+            raise ValueError(f"{count} ліній не утворюють повного дерева")
+        
+        levels = np.empty(count, dtype=np.int64)
+        for level, positions in enumerate(cls._preorder_positions(max_level)):
+            levels[positions] = level
+        return levels
+    
+    @staticmethod
+    def _polyline(segments: np.ndarray) -> np.ndarray:
+        """
+        Об'єднує лінії в одну ламану з розривами NaN між ними
+        
+        matplotlib пропускає вершини NaN, тож одна ламана малює всі лінії,
+        а колекція не створює окремий Path на кожну лінію.
+        """
+        vertices = np.full((len(segments), 3, 2), np.nan)
+        vertices[:, :2, :] = segments.reshape(-1, 2, 2)
+        return vertices.reshape(-1, 2)
+    
+    def _line_collection(self, segments: np.ndarray,
+                         level_colors: Optional[Union[str, Sequence]] = None,
+                         level_linewidths: Optional[Union[float, Sequence[float]]] = None,
+                         levels: Optional[np.ndarray] = None) -> LineCollection:
+        """
+        Будує одну LineCollection для всіх ліній
+        
+        Лінії кожного рівня об'єднуються в одну ламану, тому колекція
+        містить не більше max_level елементів незалежно від кількості ліній.
+        
+        Args:
+            segments: масив (N, 4) з координатами ліній
+            level_colors: назва колірної карти matplotlib або список кольорів за рівнями
+            level_linewidths: товщина ліній - одна для всіх або список за рівнями
+            levels: рівень кожної лінії (за замовчуванням - levels_from_lengths)
+        """
+        colors = "b"
+        linewidths = 2 if level_linewidths is None else level_linewidths
+        per_level_widths = not np.isscalar(linewidths)
+        
+        if level_colors is None and not per_level_widths:
+            return LineCollection([self._polyline(segments)], colors=colors, linewidths=linewidths)
+        
+        if levels is None:
+            levels = self.levels_from_lengths(segments)
+        depth = int(levels.max(initial=0)) + 1
+        
+        # Групуємо лінії за рівнями: одна ламана на рівень
+        order = np.argsort(levels, kind="stable")
+        bounds = np.cumsum(np.bincount(levels, minlength=depth))[:-1]
+        polylines = [self._polyline(group) for group in np.split(segments[order], bounds)]
+        
+        if level_colors is not None:
+            colors = self.level_palette(level_colors, depth)
+        if per_level_widths:
+            linewidths = np.asarray(linewidths, dtype=float)[:depth]
+        
+        return LineCollection(polylines, colors=colors, linewidths=linewidths)
+    
+    @staticmethod
+    def level_palette(level_colors: Union[str, Sequence], depth: int) -> np.ndarray:
+        """
+        Кольори RGBA (depth, 4) за рівнями
+        
+        Args:
+            level_colors: назва колірної карти matplotlib або список кольорів за рівнями
+            depth: кількість рівнів
+        """
+        if isinstance(level_colors, str):
+            return plt.get_cmap(level_colors)(np.arange(depth) / max(depth - 1, 1))
+        return to_rgba_array(level_colors)[:depth]
+    
+    def render(self, path: Optional[str] = None, title: str = "Дерево Піфагора",
+               figsize: Tuple[int, int] = (12, 8), dpi: int = 100,
+               level_colors: Optional[Union[str, Sequence]] = None,
+               level_linewidths: Optional[Union[float, Sequence[float]]] = None) -> Figure:
+        """
+        Малює дерево одним викликом LineCollection без pyplot (бекенд Agg)
+        
+        Працює без графічного середовища; формат файлу (PNG, SVG, ...)
+        визначається розширенням path.
+        
+        Args:
+            path: файл для збереження (None - лише повернути фігуру)
+            title: заголовок графіка
+            figsize: розмір фігури
+            dpi: роздільна здатність
+            level_colors: назва колірної карти або список кольорів за рівнями
+            level_linewidths: товщина ліній - одна для всіх або список за рівнями
+        
+        Returns:
+            фігура matplotlib
+        """
+        figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        
+        segments = self.get_segments()
+        axes.add_collection(self._line_collection(segments, level_colors, level_linewidths))
+        axes.autoscale_view()
+        axes.set_aspect('equal')
+        axes.set_title(title, fontsize=16, fontweight='bold')
+        axes.set_xlabel('X', fontsize=12)
+        axes.set_ylabel('Y', fontsize=12)
+        axes.grid(True, alpha=0.3)
+        # Фіксовані поля замість tight_layout, який перемальовує всю колекцію ще раз
+        figure.subplots_adjust(left=0.08, right=0.97, bottom=0.08, top=0.92)
+        
+        if path:
+            figure.savefig(path, dpi=dpi)
+        return figure
+    
+    def render_chunks(self, chunks: Iterable[np.ndarray], path: str,
+                      extent: Tuple[float, float, float, float],
+                      title: str = "Дерево Піфагора", figsize: Tuple[int, int] = (12, 8),
+                      dpi: int = 100, color: str = "b", linewidth: float = 0.5) -> int:
+        """
+        Малює потік блоків ліній у PNG, не тримаючи всіх ліній у пам'яті
+        
+        Осі малюються один раз, після чого кожен блок дорисовується поверх
+        готового полотна Agg і одразу видаляється з фігури. Межі осей
+        потрібно знати заздалегідь (див. estimate_bounds).
+        
+        Args:
+            chunks: ітерований об'єкт масивів (N, 4), наприклад iter_segment_chunks
+            path: PNG-файл для збереження
+            extent: межі осей (xmin, xmax, ymin, ymax)
+            title: заголовок графіка
+            figsize: розмір фігури
+            dpi: роздільна здатність
+            color: колір ліній
+            linewidth: товщина ліній
+        
+        Returns:
+            кількість намальованих ліній
+        """
+        figure = Figure(figsize=figsize, dpi=dpi)
+        canvas = FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        
+        xmin, xmax, ymin, ymax = extent
+        axes.set_xlim(xmin, xmax)
+        axes.set_ylim(ymin, ymax)
+        axes.set_aspect('equal')
+        axes.set_title(title, fontsize=16, fontweight='bold')
+        axes.set_xlabel('X', fontsize=12)
+        axes.set_ylabel('Y', fontsize=12)
+        axes.grid(True, alpha=0.3)
+        figure.subplots_adjust(left=0.08, right=0.97, bottom=0.08, top=0.92)
+        canvas.draw()
+        
+        drawn = 0
+        for chunk in chunks:
+            collection = LineCollection([self._polyline(chunk)], colors=color, linewidths=linewidth)
+            axes.add_collection(collection, autolim=False)
+            axes.draw_artist(collection)
+            collection.remove()
+            drawn += len(chunk)
+        
+        imsave(path, np.asarray(canvas.buffer_rgba()))
+        return drawn
+    
+    def render_stream(self, max_level: int, path: str, chunk_size: int = 65536, **kwargs) -> int:
+        """
+        Генерує і малює дерево потоково - підходить для рівнів 24 і вище
+        
+        Args:
+            max_level: максимальний рівень рекурсії
+            path: PNG-файл для збереження
+            chunk_size: кількість ліній у блоці
+            **kwargs: параметри render_chunks (title, figsize, dpi, color, linewidth)
+        
+        Returns:
+            кількість намальованих ліній
+        """
+        return self.render_chunks(self.iter_segment_chunks(max_level, chunk_size), path,
+                                  self.estimate_bounds(max_level), **kwargs)
+    
+    def save_stream(self, path: str, max_level: int, chunk_size: int = 65536) -> int:
+        """
+        Генерує дерево потоково і записує лінії у файл (див. write_segment_chunks)
+        
+        Returns:
+            кількість записаних ліній
+        """
+        return write_segment_chunks(self.iter_segment_chunks(max_level, chunk_size), path,
+                                    count=2 ** max(max_level, 0) - 1)
+    
+    def levels_from_lengths(self, segments: np.ndarray) -> np.ndarray:
+        """
+        Рівень кожної лінії за її довжиною (length = trunk_length * ratio^level)
+        
+        На відміну від segment_levels не залежить від порядку ліній, тож
+        працює для окремих блоків потоку.
+        """
+        lengths = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+        return np.rint(np.log(lengths / self.trunk_length) / np.log(self.ratio)).astype(np.int64)
+    
+    def rasterize_stream(self, max_level: int, path: str, width: int = 3840, height: int = 2160,
+                         chunk_size: int = 65536, antialias: bool = True,
+                         level_colors: Optional[Union[str, Sequence]] = None,
+                         color: Sequence[float] = (0.0, 0.0, 1.0), dtype=np.uint8) -> int:
+        """
+        Малює дерево без matplotlib: потік блоків растеризується на одне полотно NumPy
+        
+        Пам'ять обмежена полотном (3840x2160 uint8 - близько 25 МБ) і одним
+        блоком ліній, тому придатне для десятків мільйонів ліній.
+        
+        Args:
+            max_level: максимальний рівень рекурсії
+            path: PNG-файл для збереження
+            width, height: розмір зображення в пікселях
+            chunk_size: кількість ліній у блоці
+            antialias: згладжування ліній
+            level_colors: назва колірної карти або список кольорів за рівнями (None - color)
+            color: колір ліній RGB (0..1), якщо level_colors не задано
+            dtype: тип полотна - np.uint8 або np.float32
+        
+        Returns:
+            кількість намальованих ліній
+        """
+        rasterizer = SegmentRasterizer(width, height, self.estimate_bounds(max_level),
+                                       dtype=dtype, antialias=antialias)
+        palette = None
+        if level_colors is not None:
+            palette = self.level_palette(level_colors, max_level)[:, :3]
+        
+        for chunk in self.iter_segment_chunks(max_level, chunk_size):
+            if palette is None:
+                rasterizer.draw(chunk, color)
+            else:
+                levels = np.clip(self.levels_from_lengths(chunk), 0, max_level - 1)
+                rasterizer.draw(chunk, palette[levels])
+        rasterizer.save_png(path)
+        return rasterizer.segments_drawn
+    
+    def rasterize_viewport(self, viewport: Tuple[float, float, float, float], path: str,
+                           width: int = 1920, height: int = 1080, min_pixels: float = 1.0,
+                           max_level: Optional[int] = None, antialias: bool = True,
+                           level_colors: Optional[Union[str, Sequence]] = None,
+                           color: Sequence[float] = (0.0, 0.0, 1.0)) -> int:
+        """
+        Малює наближену ділянку дерева: генеруються лише видимі лінії не коротші за піксель
+        
+        Args:
+            viewport: видима область (xmin, xmax, ymin, ymax)
+            path: PNG-файл для збереження
+            width, height: розмір зображення в пікселях
+            min_pixels: мінімальна довжина лінії в пікселях
+            max_level: додаткове обмеження глибини
+            antialias: згладжування ліній
+            level_colors: назва колірної карти або список кольорів за рівнями
+            color: колір ліній RGB (0..1), якщо level_colors не задано
+        
+        Returns:
+            кількість намальованих ліній
+        """
+        # Розширюємо область до пропорцій зображення, щоб поля теж були заповнені
+        xmin, xmax, ymin, ymax = viewport
+        pixel_size = max((xmax - xmin) / width, (ymax - ymin) / height)
+        center_x, center_y = (xmin + xmax) / 2, (ymin + ymax) / 2
+        viewport = (center_x - width * pixel_size / 2, center_x + width * pixel_size / 2,
+                    center_y - height * pixel_size / 2, center_y + height * pixel_size / 2)
+        levels = self.generate_visible_levels(viewport, pixel_size, max_level, min_pixels)
+        
+        rasterizer = SegmentRasterizer(width, height, viewport, antialias=antialias)
+        palette = None if level_colors is None else self.level_palette(level_colors, len(levels))[:, :3]
+        for level, segments in enumerate(levels):
+            rasterizer.draw(segments, color if palette is None else palette[level])
+        rasterizer.save_png(path)
+        return rasterizer.segments_drawn
+    
+    def generate_square_levels(self, max_level: int, angle: float = np.pi / 4) -> List[np.ndarray]:
+        """
+        Векторизовано генерує класичне дерево Піфагора з квадратів
+        
+        Квадрат задається кутом p0 і векторами сторін u (основа) та v
+        (u, повернутий на 90 градусів). На верхній стороні квадрата будується
+        прямокутний трикутник з кутом angle при лівій вершині; його катети -
+        основи двох дочірніх квадратів зі сторонами cos(angle) і sin(angle)
+        від батьківської. Перший квадрат стоїть на початку стовбура, має
+        сторону trunk_length і спрямований уздовж стовбура.
+        
+        Args:
+            max_level: кількість рівнів квадратів
+            angle: кут трикутника при лівій вершині (45 градусів - симетричне дерево)
+        
+        Returns:
+            список масивів (2^level, 4, 2) з вершинами квадратів кожного рівня
+        """
+        if max_level <= 0:
+            return []
+        if not 0 < angle < np.pi / 2:
+            raise ValueError("Кут трикутника має бути в межах (0, pi/2)")
+        
+        x1, y1, x2, y2 = self.trunk
+        v = np.array([[x2 - x1, y2 - y1]])
+        u = np.column_stack((v[:, 1], -v[:, 0]))
+        p0 = np.array([[x1, y1]]) - u / 2
+        
+        # Поворот на angle з масштабом cos(angle): основа лівої дитини
+        cos_a, sin_a = np.cos(angle), np.sin(angle)
+        
+        levels = []
+        for level in range(max_level):
+            v = np.column_stack((-u[:, 1], u[:, 0]))
+            levels.append(np.stack((p0, p0 + u, p0 + u + v, p0 + v), axis=1))
+            if level + 1 == max_level:
+                break
+            
+            top_left = p0 + v
+            top_right = top_left + u
+            left_u = cos_a * np.column_stack((cos_a * u[:, 0] - sin_a * u[:, 1],
+                                              sin_a * u[:, 0] + cos_a * u[:, 1]))
+            apex = top_left + left_u
+            
+            # Діти кожного квадрата йдуть парами (лівий, правий)
+            p0 = np.empty((2 * len(u), 2))
+            p0[0::2], p0[1::2] = top_left, apex
+            child_u = np.empty_like(p0)
+            child_u[0::2], child_u[1::2] = left_u, top_right - apex
+            u = child_u
+        return levels
+    
+    def create_square_tree(self, max_level: int = 10, angle: float = np.pi / 4) -> np.ndarray:
+        """
+        Створює дерево з квадратів (див. generate_square_levels)
+        
+        Returns:
+            масив self.squares (2^max_level - 1, 4, 2), квадрати впорядковані за рівнями
+        """
+        levels = self.generate_square_levels(max_level, angle)
+        self.squares = np.concatenate(levels) if levels else np.empty((0, 4, 2))
+        return self.squares
+    
+    def render_squares(self, path: Optional[str] = None, title: str = "Дерево Піфагора з квадратів",
+                       figsize: Tuple[int, int] = (12, 8), dpi: int = 100,
+                       level_colors: Union[str, Sequence] = "summer",
+                       edgecolor: Optional[str] = None) -> Figure:
+        """
+        Малює self.squares однією PolyCollection без pyplot (бекенд Agg)
+        
+        Args:
+            path: файл для збереження (None - лише повернути фігуру)
+            title: заголовок графіка
+            figsize: розмір фігури
+            dpi: роздільна здатність
+            level_colors: назва колірної карти або список кольорів за рівнями
+            edgecolor: колір контурів (None - без контурів, швидше для глибоких дерев)
+        
+        Returns:
+            фігура matplotlib
+        """
+        count = len(self.squares)
+        levels = np.repeat(np.arange(count.bit_length()), 2 ** np.arange(count.bit_length()))[:count]
+        palette = self.level_palette(level_colors, int(levels.max(initial=0)) + 1)
         
-        # Починаємо рекурсію
-        self.pythagorean_tree(x1, y1, x2, y2, 0, max_level, np.pi / 2)  # 90 градусів вгору
+        figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        
+        collection = PolyCollection(self.squares, facecolors=palette[levels],
+                                    edgecolors=edgecolor or "none",
+                                    linewidths=0.3 if edgecolor else 0)
+        # Межі беремо прямо з вершин: обхід сотень тисяч Path для autolim довший за сам рендеринг
+        axes.add_collection(collection, autolim=False)
+        axes.update_datalim(self.squares.reshape(-1, 2))
+        axes.autoscale_view()
+        axes.set_aspect('equal')
+        axes.set_title(title, fontsize=16, fontweight='bold')
+        axes.set_xlabel('X', fontsize=12)
+        axes.set_ylabel('Y', fontsize=12)
+        axes.grid(True, alpha=0.3)
+        figure.subplots_adjust(left=0.08, right=0.97, bottom=0.08, top=0.92)
+        
+        if path:
+            figure.savefig(path, dpi=dpi)
+        return figure
     
     def visualize(self, title: str = "Дерево Піфагора", 
                   figsize: Tuple[int, int] = (12, 8)) -> None:
@@ -104,10 +858,9 @@ class PythagoreanTree:
         """
         plt.figure(figsize=figsize)
         
-        # Малюємо всі лінії
-        for line in self.lines:
-            x1, y1, x2, y2 = line
-            plt.plot([x1, x2], [y1, y2], 'b-', linewidth=2)
+        # Малюємо всі лінії однією колекцією (після векторизованої генерації - з self.segments)
+        plt.gca().add_collection(self._line_collection(self.get_segments()))
+        plt.gca().autoscale_view()
         
         plt.title(title, fontsize=16, fontweight='bold')
         plt.xlabel('X', fontsize=12)
@@ -118,6 +871,385 @@ class PythagoreanTree:
         plt.show()
 
 
+def write_png(path: str, image: np.ndarray) -> None:
+    """
+    Записує 8-бітне зображення (H, W), (H, W, 3) або (H, W, 4) у PNG
+    
+    Використовує лише zlib і struct зі стандартної бібліотеки: рядки без
+    фільтрів, один блок IDAT.
+    """
+    image = np.asarray(image)
+    if image.dtype != np.uint8:
+        raise ValueError("PNG записується з масиву uint8")
+    if image.ndim == 2:
+        image = image[:, :, None]
+    height, width, channels = image.shape
+    color_types = {1: 0, 3: 2, 4: 6}
+    if channels not in color_types:
+        raise ValueError(f"Непідтримувана кількість каналів: {channels}")
+    
+    # Кожен рядок PNG починається байтом типу фільтра (0 - без фільтра)
+    raw = np.zeros((height, 1 + width * channels), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, -1)
+    
+    def png_chunk(tag: bytes, data: bytes) -> bytes:
+        return (struct.pack(">I", len(data)) + tag + data
+                + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+    
+    header = struct.pack(">IIBBBBB", width, height, 8, color_types[channels], 0, 0, 0)
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(png_chunk(b"IHDR", header))
+        file.write(png_chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)))
+        file.write(png_chunk(b"IEND", b""))
+
+
+class SegmentRasterizer:
+    """
+    Растеризатор ліній на чистому NumPy з одним спільним полотном
+    
+    Блоки ліній малюються по черзі на те саме полотно, тому пам'ять
+    обмежена розміром зображення та одного блоку, а не кількістю ліній.
+    Лінія дискретизується з кроком не більше пікселя; з антиаліасингом
+    кожна точка розподіляється білінійно між чотирма сусідніми пікселями.
+    """
+    
+    def __init__(self, width: int, height: int, extent: Tuple[float, float, float, float],
+                 background: Sequence[float] = (1.0, 1.0, 1.0), dtype=np.uint8,
+                 antialias: bool = True, max_samples: int = 1 << 21):
+        """
+        Args:
+            width, height: розмір зображення в пікселях
+            extent: область площини (xmin, xmax, ymin, ymax); масштаб по осях однаковий
+            background: колір фону RGB у межах 0..1
+            dtype: тип полотна - np.uint8 (менше пам'яті) або np.float32 (без округлень)
+            antialias: згладжування ліній
+            max_samples: максимум точок дискретизації за один прохід
+        """
+        if np.dtype(dtype) not in (np.dtype(np.uint8), np.dtype(np.float32)):
+            raise ValueError("Полотно може мати тип uint8 або float32")
+        if width < 1 or height < 1:
+            raise ValueError("Розмір зображення має бути додатним")
+        
+        self.width = width
+        self.height = height
+        self.antialias = antialias
+        self.max_samples = max_samples
+        self.scale = 255.0 if np.dtype(dtype) == np.uint8 else 1.0
+        self.canvas = np.empty((height, width, 3), dtype=dtype)
+        self.canvas[...] = np.asarray(background, dtype=np.float32) * self.scale
+        self.segments_drawn = 0
+        
+        # Однаковий масштаб по осях, область центрується на зображенні
+        xmin, xmax, ymin, ymax = extent
+        self.pixels_per_unit = min((width - 1) / ((xmax - xmin) or 1.0),
+                                   (height - 1) / ((ymax - ymin) or 1.0))
+        self.offset_x = ((width - 1) - (xmax - xmin) * self.pixels_per_unit) / 2 - xmin * self.pixels_per_unit
+        self.offset_y = ((height - 1) - (ymax - ymin) * self.pixels_per_unit) / 2 - ymin * self.pixels_per_unit
+    
+    def to_pixels(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Координати площини -> (стовпець, рядок) пікселя; вісь y спрямована вгору"""
+        column = x * self.pixels_per_unit + self.offset_x
+        row = (self.height - 1) - (y * self.pixels_per_unit + self.offset_y)
+        return column, row
+    
+    def _clip(self, x1: np.ndarray, y1: np.ndarray, x2: np.ndarray,
+              y2: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Обрізає лінії межами полотна (алгоритм Ліанга-Барскі для всього масиву)
+        
+        Returns:
+            (x1, y1, x2, y2, keep) - обрізані кінці та маска ліній, що перетинають полотно
+        """
+        dx = x2 - x1
+        dy = y2 - y1
+        t0 = np.zeros_like(x1)
+        t1 = np.ones_like(x1)
+        keep = np.ones(x1.shape, dtype=bool)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for p, q in ((-dx, x1 + 1), (dx, self.width - x1), (-dy, y1 + 1), (dy, self.height - y1)):
+                parallel = p == 0
+                keep &= ~(parallel & (q < 0))
+                ratio = q / p
+                t0 = np.where(p < 0, np.maximum(t0, ratio), t0)
+                t1 = np.where(p > 0, np.minimum(t1, ratio), t1)
+        keep &= t0 <= t1
+        return x1 + t0 * dx, y1 + t0 * dy, x1 + t1 * dx, y1 + t1 * dy, keep
+    
+    def draw(self, segments: np.ndarray, colors: Union[Sequence[float], np.ndarray] = (0.0, 0.0, 1.0)) -> None:
+        """
+        Малює блок ліній на полотні
+        
+        Args:
+            segments: масив (N, 4) з координатами (x1, y1, x2, y2)
+            colors: один колір RGB (0..1) або масив (N, 3) - колір кожної лінії
+        """
+        segments = np.asarray(segments, dtype=float).reshape(-1, 4)
+        colors = np.broadcast_to(np.asarray(colors, dtype=np.float32), (len(segments), 3))
+        self.segments_drawn += len(segments)
+        
+        x1, y1 = self.to_pixels(segments[:, 0], segments[:, 1])
+        x2, y2 = self.to_pixels(segments[:, 2], segments[:, 3])
+        x1, y1, x2, y2, keep = self._clip(x1, y1, x2, y2)
+        if not keep.all():
+            x1, y1, x2, y2 = x1[keep], y1[keep], x2[keep], y2[keep]
+            # Спільний колір лишається поширеним (broadcast) без копіювання
+            colors = colors[keep] if colors.strides[0] else colors[:len(x1)]
+        if not len(x1):
+            return
+        
+        # Кількість точок на лінію: крок не більше пікселя за довшою віссю,
+        # включно з кінцями; лінії коротші за піксель (більшість ліній
+        # глибокого дерева) дають одну точку - свою середину
+        spans = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1))
+        counts = np.where(spans < 1, 1, np.ceil(spans) + 1).astype(np.int64)
+        self._draw_samples(x1, y1, x2, y2, colors, counts)
+    
+    def _draw_samples(self, x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                      colors: np.ndarray, counts: np.ndarray) -> None:
+        """Дискретизує лінії і накладає їх на полотно за покриттям пікселів"""
+        ends = np.cumsum(counts)
+        if ends[-1] > self.max_samples and len(counts) > 1:
+            # Забагато точок за раз - ділимо блок навпіл, щоб обмежити пам'ять
+            middle = len(counts) // 2
+            self._draw_samples(x1[:middle], y1[:middle], x2[:middle], y2[:middle],
+                               colors[:middle], counts[:middle])
+            self._draw_samples(x1[middle:], y1[middle:], x2[middle:], y2[middle:],
+                               colors[middle:], counts[middle:])
+            return
+        
+        owner = np.repeat(np.arange(len(counts)), counts)
+        step = np.arange(ends[-1]) - np.repeat(ends - counts, counts)
+        intervals = (counts - 1)[owner]
+        t = np.where(intervals > 0, step / np.maximum(intervals, 1), 0.5)
+        column = x1[owner] + t * (x2 - x1)[owner]
+        row = y1[owner] + t * (y2 - y1)[owner]
+        
+        if self.antialias:
+            left, top = np.floor(column), np.floor(row)
+            ax, ay = column - left, row - top
+            columns = np.concatenate((left, left + 1, left, left + 1))
+            rows = np.concatenate((top, top, top + 1, top + 1))
+            weights = np.concatenate(((1 - ax) * (1 - ay), ax * (1 - ay), (1 - ax) * ay, ax * ay))
+            owner = np.tile(owner, 4)
+        else:
+            columns, rows = np.rint(column), np.rint(row)
+            weights = np.ones(len(column))
+        
+        # Після обрізання за межі полотна виходять лише крайні точки
+        if (columns.min() < 0 or columns.max() >= self.width
+                or rows.min() < 0 or rows.max() >= self.height):
+            inside = (columns >= 0) & (columns < self.width) & (rows >= 0) & (rows < self.height)
+            rows, columns = rows[inside], columns[inside]
+            weights, owner = weights[inside], owner[inside]
+            if not len(rows):
+                return
+        rows, columns = rows.astype(np.int64), columns.astype(np.int64)
+        
+        # Блок потоку - це піддерево, тож його точки зазвичай займають невеликий
+        # прямокутник: лічимо покриття щільно в ньому, без сортування
+        top, left = rows.min(), columns.min()
+        box_width = int(columns.max() - left) + 1
+        area = box_width * (int(rows.max() - top) + 1)
+        local = (rows - top) * box_width + (columns - left)
+        # groups - номер комірки кожної точки, touched - вибірка зачеплених комірок
+        if area <= 4 * len(local) + 65536:
+            groups, group_count = local, area
+            coverage = np.bincount(groups, weights, minlength=group_count)
+            touched = np.flatnonzero(coverage)
+            coverage = coverage[touched]
+            pixels = (touched // box_width + top) * self.width + touched % box_width + left
+        else:
+            pixels, groups = np.unique(rows * self.width + columns, return_inverse=True)
+            group_count, touched = len(pixels), slice(None)
+            coverage = np.bincount(groups, weights, minlength=group_count)
+        if not len(pixels):
+            return
+        
+        # Покриття й середній колір кожного зачепленого пікселя
+        if colors.strides[0] == 0:
+            # Один колір на весь блок - усереднювати нічого
+            paint = np.broadcast_to(colors[0], (len(pixels), 3))
+        else:
+            paint = np.empty((len(pixels), 3), dtype=np.float32)
+            for channel in range(3):
+                paint[:, channel] = np.bincount(groups, weights * colors[owner, channel],
+                                                minlength=group_count)[touched]
+            paint /= np.maximum(coverage, 1e-12)[:, None]
+        alpha = np.minimum(coverage, 1.0).astype(np.float32)[:, None]
+        
+        canvas = self.canvas.reshape(-1, 3)
+        blended = canvas[pixels].astype(np.float32) * (1 - alpha) + paint * (self.scale * alpha)
+        canvas[pixels] = np.rint(blended) if self.canvas.dtype == np.uint8 else blended
+    
+    def draw_chunks(self, chunks: Iterable[np.ndarray],
+                    colors: Union[Sequence[float], np.ndarray] = (0.0, 0.0, 1.0)) -> int:
+        """Малює потік блоків (наприклад, iter_segment_chunks) одним кольором; повертає кількість ліній"""
+        drawn = 0
+        for chunk in chunks:
+            self.draw(chunk, colors)
+            drawn += len(chunk)
+        return drawn
+    
+    def image(self) -> np.ndarray:
+        """Полотно як зображення uint8 (H, W, 3)"""
+        if self.canvas.dtype == np.uint8:
+            return self.canvas
+        return np.rint(np.clip(self.canvas, 0.0, 1.0) * 255).astype(np.uint8)
+    
+    def save_png(self, path: str) -> None:
+        """Зберігає полотно у PNG (див. write_png)"""
+        write_png(path, self.image())
+
+
+class TilePyramid:
+    """
+    Піраміда тайлів z/x/y для масштабованого перегляду дерева
+    
+    Світ - квадрат, що містить усе дерево; на рівні z він ділиться на
+    2^z x 2^z тайлів, y рахується згори, як у веб-картах. Кожен тайл
+    генерує лише лінії, що його перетинають (generate_visible_levels), і
+    растеризується NumPy. Тайли кешуються на диску в каталозі, ключ якого -
+    хеш параметрів дерева та рендерингу, тож після зміни параметрів
+    малюються лише відсутні тайли.
+    """
+    
+    def __init__(self, tree: PythagoreanTree, cache_dir: str, tile_size: int = 256,
+                 min_pixels: float = 1.0, antialias: bool = True,
+                 level_colors: Optional[Union[str, Sequence]] = None,
+                 color: Sequence[float] = (0.0, 0.0, 1.0), color_levels: int = 24):
+        """
+        Args:
+            tree: дерево з потрібними параметрами
+            cache_dir: кореневий каталог кешу тайлів
+            tile_size: розмір тайла в пікселях
+            min_pixels: мінімальна довжина лінії в пікселях
+            antialias: згладжування ліній
+            level_colors: назва колірної карти або список кольорів за рівнями
+            color: колір ліній RGB (0..1), якщо level_colors не задано
+            color_levels: кількість рівнів, на які розтягується колірна карта
+        """
+        self.tree = tree
+        self.cache_dir = cache_dir
+        self.options = {"tile_size": tile_size, "min_pixels": min_pixels, "antialias": antialias,
+                        "level_colors": level_colors, "color": tuple(color),
+                        "color_levels": color_levels}
+        self.palette = None
+        if level_colors is not None:
+            self.palette = tree.level_palette(level_colors, color_levels)[:, :3]
+        
+        # Квадрат навколо всього дерева (глибина 64 - практично нескінченне дерево)
+        xmin, xmax, ymin, ymax = tree.estimate_bounds(64)
+        half = max(xmax - xmin, ymax - ymin) / 2
+        center_x, center_y = (xmin + xmax) / 2, (ymin + ymax) / 2
+        self.world = (center_x - half, center_x + half, center_y - half, center_y + half)
+        
+        # Ключ кешу - хеш параметрів дерева і рендерингу; обчислюється один раз,
+        # а не для кожного тайла в tile_path
+        description = json.dumps({"tree": tree.parameters(), "render": self.options},
+                                 sort_keys=True, default=str)
+        self.key = hashlib.sha1(description.encode("utf-8")).hexdigest()[:16]
+    
+    def tile_path(self, z: int, x: int, y: int) -> str:
+        """Шлях тайла в кеші: <cache_dir>/<key>/z/x/y.png"""
+        return os.path.join(self.cache_dir, self.key, str(z), str(x), f"{y}.png")
+    
+    def tile_viewport(self, z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+        """Область площини (xmin, xmax, ymin, ymax), яку покриває тайл"""
+        count = 2 ** z
+        if not (0 <= x < count and 0 <= y < count):
+            raise ValueError(f"Тайл {z}/{x}/{y} поза пірамідою")
+        xmin, xmax, ymin, ymax = self.world
+        step = (xmax - xmin) / count
+        top = ymax - y * step
+        return (xmin + x * step, xmin + (x + 1) * step, top - step, top)
+    
+    def render_tile(self, z: int, x: int, y: int) -> str:
+        """
+        Малює тайл, якщо його ще немає в кеші
+        
+        Returns:
+            шлях до PNG тайла
+        """
+        path = self.tile_path(z, x, y)
+        if os.path.exists(path):
+            return path
+        
+        size = self.options["tile_size"]
+        xmin, xmax, ymin, ymax = self.tile_viewport(z, x, y)
+        pixel_size = (xmax - xmin) / size
+        
+        # Генеруємо з запасом у піксель, щоб згладжені краї сусідніх тайлів збігалися
+        margin = pixel_size
+        levels = self.tree.generate_visible_levels((xmin - margin, xmax + margin, ymin - margin, ymax + margin),
+                                                   pixel_size, min_pixels=self.options["min_pixels"])
+        
+        # Центри пікселів лежать на півпікселя всередині тайла
+        half = pixel_size / 2
+        rasterizer = SegmentRasterizer(size, size, (xmin + half, xmax - half, ymin + half, ymax - half),
+                                       antialias=self.options["antialias"])
+        for level, segments in enumerate(levels):
+            if self.palette is None:
+                rasterizer.draw(segments, self.options["color"])
+            else:
+                rasterizer.draw(segments, self.palette[min(level, len(self.palette) - 1)])
+        
+        # Запис через тимчасовий файл: паралельні процеси не побачать половину тайла
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        rasterizer.save_png(temporary)
+        os.replace(temporary, path)
+        return path
+    
+    def render_tiles(self, tiles: Sequence[Tuple[int, int, int]], workers: Optional[int] = None) -> dict:
+        """
+        Малює тайли паралельно на пулі процесів, пропускаючи вже закешовані
+        
+        Args:
+            tiles: координати (z, x, y)
+            workers: кількість процесів (None - кількість ядер)
+        
+        Returns:
+            словник з кількістю намальованих і закешованих тайлів та часом
+        """
+        missing = [tile for tile in tiles if not os.path.exists(self.tile_path(*tile))]
+        workers = workers or os.cpu_count() or 1
+        
+        started = time.perf_counter()
+        if workers < 2 or len(missing) < 2:
+            for tile in missing:
+                self.render_tile(*tile)
+        else:
+            tasks = [(self.tree.parameters(), self.cache_dir, self.options, tile) for tile in missing]
+            with ProcessPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+                list(executor.map(_render_tile_task, tasks))
+        seconds = time.perf_counter() - started
+        
+        return {"rendered": len(missing), "cached": len(tiles) - len(missing), "seconds": seconds,
+                "tiles_per_second": len(missing) / seconds if seconds else float("inf")}
+    
+    def render_pyramid(self, max_zoom: int, workers: Optional[int] = None) -> dict:
+        """
+        Малює всі тайли рівнів 0..max_zoom
+        
+        Returns:
+            підсумок render_tiles для всієї піраміди
+        """
+        tiles = [(z, x, y) for z in range(max_zoom + 1)
+                 for x in range(2 ** z) for y in range(2 ** z)]
+        result = self.render_tiles(tiles, workers)
+        print(f"Піраміда до рівня {max_zoom}: намальовано {result['rendered']}, "
+              f"з кешу {result['cached']} тайлів за {result['seconds']:.2f}с")
+        return result
+
+
+def _render_tile_task(task: Tuple[dict, str, dict, Tuple[int, int, int]]) -> str:
+    """Малює один тайл (виконується в процесі пулу)"""
+    parameters, cache_dir, options, tile = task
+    return TilePyramid(PythagoreanTree(**parameters), cache_dir, **options).render_tile(*tile)
+
+
 def get_user_input() -> int:
     """
     Отримує від користувача рівень рекурсії
@@ -184,6 +1316,331 @@ def interactive_mode():
             print(f"Виникла помилка: {e}")
 
 
+def write_segment_chunks(chunks: Iterable[np.ndarray], path: str,
+                         count: Optional[int] = None) -> int:
+    """
+    Записує потік блоків ліній у файл, не збираючи їх у пам'яті
+    
+    Формат визначається розширенням: .npy - масив (count, 4) float64, який
+    можна відкрити через np.load(path, mmap_mode="r") (потрібна кількість
+    ліній count); .csv - текст із рядками x1,y1,x2,y2; інше - сирі float64.
+    
+    Args:
+        chunks: ітерований об'єкт масивів (N, 4)
+        path: шлях до файлу
+        count: загальна кількість ліній (обов'язкова для .npy)
+    
+    Returns:
+        кількість записаних ліній
+    """
+    extension = os.path.splitext(path)[1].lower()
+    written = 0
+    
+    if extension == ".npy":
+        if count is None:
+            raise ValueError("Для формату .npy потрібна кількість ліній count")
+        output = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(count, 4))
+        try:
+            for chunk in chunks:
+                if written + len(chunk) > count:
+                    raise ValueError(f"Потік містить більше ніж {count} ліній")
+                output[written:written + len(chunk)] = chunk
+                written += len(chunk)
+            output.flush()
+        finally:
+            del output
+    else:
+        with open(path, "wb") as file:
+            for chunk in chunks:
+                if extension == ".csv":
+                    np.savetxt(file, chunk, delimiter=",", fmt="%.17g")
+                else:
+                    np.ascontiguousarray(chunk, dtype=np.float64).tofile(file)
+                written += len(chunk)
+    
+    if count is not None and written != count:
+        raise ValueError(f"Очікувалось {count} ліній, записано {written}")
+    return written
+
+
+def _format_parameter(value) -> str:
+    """Коротке текстове подання значення параметра для заголовка"""
+    if isinstance(value, float):
+        return f"{value:.3g}"
+    if isinstance(value, tuple):
+        return "(" + ", ".join(_format_parameter(item) for item in value) + ")"
+    return str(value)
+
+
+def _render_sweep_item(task: Tuple[dict, int, str, dict]) -> str:
+    """Будує й малює одне дерево сітки параметрів (виконується в процесі пулу)"""
+    parameters, max_level, path, render_options = task
+    tree = PythagoreanTree(**parameters)
+    tree.create_tree_table(max_level)
+    tree.render(path, **render_options)
+    return path
+
+
+def render_parameter_sweep(grid: dict, max_level: int, directory: str,
+                           workers: Optional[int] = None, image_format: str = "png",
+                           **render_options) -> dict:
+    """
+    Малює дерева для всіх комбінацій параметрів паралельно на пулі процесів
+    
+    Args:
+        grid: словник {параметр PythagoreanTree: список значень}, наприклад
+              {"branch_angle": [np.pi / 6, np.pi / 4], "ratio": [0.6, 0.7]};
+              малюється декартів добуток значень
+        max_level: рівень рекурсії кожного дерева
+        directory: каталог для зображень (створюється за потреби)
+        workers: кількість процесів (None - кількість ядер)
+        image_format: розширення файлів (png, svg, ...)
+        **render_options: параметри render (figsize, dpi, level_colors, ...)
+    
+    Returns:
+        словник зі шляхами файлів, параметрами, часом і кількістю дерев за секунду
+    """
+    names = list(grid)
+    combinations = [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+    
+    # Некоректні параметри мають падати тут, а не всередині пулу
+    for parameters in combinations:
+        PythagoreanTree(**parameters)
+    
+    os.makedirs(directory, exist_ok=True)
+    tasks = []
+    for index, parameters in enumerate(combinations):
+        options = dict(render_options)
+        options.setdefault("title", ", ".join(f"{name}={_format_parameter(value)}"
+                                              for name, value in parameters.items()))
+        path = os.path.join(directory, f"tree_{index:04d}.{image_format}")
+        tasks.append((parameters, max_level, path, options))
+    
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    if workers < 2 or len(tasks) < 2:
+        paths = [_render_sweep_item(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            paths = list(executor.map(_render_sweep_item, tasks))
+    seconds = time.perf_counter() - started
+    
+    trees_per_second = len(paths) / seconds if seconds else float("inf")
+    print(f"Сітка параметрів: {len(paths)} дерев рівня {max_level} за {seconds:.2f}с "
+          f"({trees_per_second:.1f} дерев/с, процесів: {min(workers, max(len(tasks), 1))})")
+    return {"paths": paths, "parameters": combinations, "seconds": seconds,
+            "trees_per_second": trees_per_second, "workers": workers}
+
+
+def benchmark_parameter_sweep(max_level: int = 12) -> List[dict]:
+    """
+    Порівнює пропускну здатність сітки параметрів в одному процесі та на всіх ядрах
+    
+    Args:
+        max_level: рівень рекурсії кожного дерева
+    
+    Returns:
+        результати render_parameter_sweep для обох запусків
+    """
+    grid = {"branch_angle": np.linspace(np.pi / 8, np.pi / 3, 4), "ratio": [0.6, 0.65, 0.7, 0.75]}
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in (1, None):
+            results.append(render_parameter_sweep(grid, max_level, directory, workers=workers,
+                                                  figsize=(6, 4), dpi=80))
+    return results
+
+
+def benchmark_streaming(max_level: int = 20, chunk_size: int = 65536) -> dict:
+    """
+    Вимірює потокову генерацію глибокого дерева та пікову пам'ять
+    
+    Args:
+        max_level: рівень рекурсії
+        chunk_size: кількість ліній у блоці
+    
+    Returns:
+        словник з часом, кількістю ліній і піковою пам'яттю tracemalloc
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = sum(len(chunk) for chunk in PythagoreanTree().iter_segment_chunks(max_level, chunk_size))
+    seconds = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    full_bytes = count * 4 * 8
+    print(f"Потік, рівень {max_level}: {count} ліній за {seconds:.2f}с, "
+          f"пікова пам'ять {peak / 2**20:.1f} МБ (повний масив - {full_bytes / 2**20:.0f} МБ)")
+    return {"level": max_level, "segments": count, "seconds": seconds,
+            "peak_bytes": peak, "full_bytes": full_bytes}
+
+
+def benchmark_rasterizer(max_level: int = 22, width: int = 3840, height: int = 2160) -> dict:
+    """
+    Вимірює потокову растеризацію NumPy у 4K: час і пікову пам'ять
+    
+    Args:
+        max_level: рівень рекурсії (22 - понад 4M ліній, 24 - понад 16M)
+        width, height: розмір зображення
+    
+    Returns:
+        словник з кількістю ліній, часом і піковою пам'яттю tracemalloc
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        tracemalloc.start()
+        started = time.perf_counter()
+        count = PythagoreanTree().rasterize_stream(max_level, os.path.join(directory, "tree.png"),
+                                                   width, height, level_colors="viridis")
+        seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    
+    print(f"Растеризація NumPy {width}x{height}, рівень {max_level}: {count} ліній за {seconds:.2f}с "
+          f"({count / seconds / 1e6:.2f}M ліній/с), пікова пам'ять {peak / 2**20:.0f} МБ")
+    return {"level": max_level, "segments": count, "seconds": seconds, "peak_bytes": peak}
+
+
+def benchmark_viewport_culling(max_level: int = 20) -> dict:
+    """
+    Порівнює повну генерацію з генерацією лише видимої ділянки при наближенні
+    
+    Args:
+        max_level: рівень рекурсії повного дерева
+    
+    Returns:
+        словник з часом і кількістю ліній обох способів
+    """
+    tree = PythagoreanTree()
+    started = time.perf_counter()
+    full_count = len(tree.create_tree_vectorized(max_level))
+    full_seconds = time.perf_counter() - started
+    
+    # Ділянка 0.2 x 0.2 у правій частині крони при ширині зображення 1000 пікселів
+    viewport = (3.0, 3.2, 3.0, 3.2)
+    started = time.perf_counter()
+    visible_count = len(tree.create_tree_viewport(viewport, pixel_size=0.2 / 1000, max_level=max_level))
+    visible_seconds = time.perf_counter() - started
+    
+    print(f"Наближення, рівень {max_level}: повне дерево {full_count} ліній за {full_seconds:.3f}с, "
+          f"видима ділянка {visible_count} ліній за {visible_seconds:.4f}с")
+    return {"level": max_level, "full_segments": full_count, "full_seconds": full_seconds,
+            "visible_segments": visible_count, "visible_seconds": visible_seconds}
+
+
+def benchmark_tile_pyramid(max_zoom: int = 3) -> List[dict]:
+    """
+    Вимірює побудову піраміди тайлів і повторний запуск із кешу
+    
+    Args:
+        max_zoom: найглибший рівень піраміди
+    
+    Returns:
+        підсумки render_pyramid для першого та повторного запуску
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        pyramid = TilePyramid(PythagoreanTree(), directory, level_colors="viridis")
+        results = [pyramid.render_pyramid(max_zoom), pyramid.render_pyramid(max_zoom)]
+    print(f"Тайлів за секунду: {results[0]['tiles_per_second']:.1f}")
+    return results
+
+
+def benchmark_square_tree(max_level: int = 18) -> dict:
+    """
+    Вимірює генерацію та рендеринг дерева з квадратів однією PolyCollection
+    
+    Args:
+        max_level: кількість рівнів квадратів
+    
+    Returns:
+        словник з кількістю квадратів і часом генерації та рендерингу
+    """
+    tree = PythagoreanTree()
+    started = time.perf_counter()
+    count = len(tree.create_square_tree(max_level))
+    generate_seconds = time.perf_counter() - started
+    
+    with tempfile.TemporaryDirectory() as directory:
+        started = time.perf_counter()
+        tree.render_squares(os.path.join(directory, "squares.png"))
+        render_seconds = time.perf_counter() - started
+    
+    print(f"Дерево з квадратів, рівень {max_level}: {count} квадратів, "
+          f"генерація {generate_seconds:.3f}с, рендеринг {render_seconds:.2f}с")
+    return {"level": max_level, "squares": count, "generate_seconds": generate_seconds,
+            "render_seconds": render_seconds}
+
+
+def benchmark_generation(levels: Tuple[int, ...] = (12, 14, 16)) -> List[dict]:
+    """
+    Порівнює час рекурсивної та векторизованої генерації дерева
+    
+    Args:
+        levels: рівні рекурсії для вимірювання
+    
+    Returns:
+        список словників з часом обох способів і прискоренням
+    """
+    results = []
+    for level in levels:
+        started = time.perf_counter()
+        PythagoreanTree().create_tree(level)
+        recursive_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        PythagoreanTree().create_tree_vectorized(level)
+        vectorized_seconds = time.perf_counter() - started
+        
+        speedup = recursive_seconds / vectorized_seconds if vectorized_seconds else float("inf")
+        results.append({"level": level, "recursive_seconds": recursive_seconds,
+                        "vectorized_seconds": vectorized_seconds, "speedup": speedup})
+        print(f"Рівень {level}: рекурсія {recursive_seconds:.3f}с, "
+              f"NumPy {vectorized_seconds:.4f}с, прискорення x{speedup:.0f}")
+    return results
+
+
+def benchmark_rotation_tables(levels: Tuple[int, ...] = (12, 14, 16)) -> List[dict]:
+    """
+    Порівнює рекурсивну генерацію, векторизовану з тригонометрією та табличну
+    
+    Args:
+        levels: рівні рекурсії для вимірювання
+    
+    Returns:
+        список словників з часом трьох способів і прискоренням таблиць
+    """
+    results = []
+    for level in levels:
+        timings = {}
+        for name, build in (("recursive", PythagoreanTree().create_tree),
+                            ("vectorized", PythagoreanTree().create_tree_vectorized),
+                            ("table", PythagoreanTree().create_tree_table)):
+            started = time.perf_counter()
+            build(level)
+            timings[name] = time.perf_counter() - started
+        
+        speedup = timings["recursive"] / timings["table"] if timings["table"] else float("inf")
+        results.append({"level": level, **{f"{name}_seconds": seconds for name, seconds in timings.items()},
+                        "speedup": speedup})
+        print(f"Рівень {level}: рекурсія {timings['recursive']:.3f}с, "
+              f"NumPy cos/sin {timings['vectorized']:.4f}с, таблиці {timings['table']:.4f}с, "
+              f"прискорення x{speedup:.0f}")
+    return results
+
+
+def run_benchmarks() -> None:
+    """Запускає всі бенчмарки продуктивності"""
+    print("=== Бенчмарки продуктивності ===\n")
+    benchmark_generation()
+    benchmark_rotation_tables()
+    benchmark_streaming()
+    benchmark_rasterizer()
+    benchmark_viewport_culling()
+    benchmark_tile_pyramid()
+    benchmark_square_tree()
+    benchmark_parameter_sweep()
+
+
 def test_recursive_function():
     """Тестування рекурсивної функції"""
     print("=== Тестування рекурсивної функції ===\n")
@@ -214,6 +1671,158 @@ def test_recursive_function():
         print(f"Рівень {level}: очікувано {expected_lines}, отримано {actual_lines}")
         assert actual_lines == expected_lines, f"Неспівпадіння для рівня {level}"
     print("✓ Всі тести пройдено\n")
+    
+    # Тест 4: Векторизована генерація дає ті самі лінії
+    print("Тест 4: Векторизована генерація збігається з рекурсивною")
+    for level in range(0, 9):
+        recursive_tree = PythagoreanTree()
+        recursive_tree.create_tree(level)
+        segments = PythagoreanTree().create_tree_vectorized(level)
+        expected = np.array(recursive_tree.lines, dtype=float).reshape(-1, 4)
+        assert np.array_equal(segments, expected), f"Неспівпадіння для рівня {level}"
+    print("✓ Тест пройдено\n")
+    
+    # Тест 5: Рендеринг однією колекцією без графічного середовища
+    print("Тест 5: Рендеринг у PNG через бекенд Agg")
+    tree5 = PythagoreanTree()
+    tree5.create_tree_vectorized(6)
+    levels = PythagoreanTree.segment_levels(len(tree5.segments))
+    assert np.bincount(levels).tolist() == [1, 2, 4, 8, 16, 32]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.png")
+        tree5.render(path, level_colors="viridis", level_linewidths=[3, 2.5, 2, 1.5, 1, 0.5])
+        assert os.path.getsize(path) > 0
+    print("✓ Тест пройдено\n")
+    
+    # Тест 6: Потокова генерація блоками з явним стеком
+    print("Тест 6: Потокова генерація збігається з векторизованою")
+    expected = PythagoreanTree().create_tree_vectorized(9)
+    for chunk_size in (1, 7, 100, 1000):
+        chunks = list(PythagoreanTree().iter_segment_chunks(9, chunk_size))
+        assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+        assert np.array_equal(np.concatenate(chunks), expected), f"Неспівпадіння для блоку {chunk_size}"
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.npy")
+        assert PythagoreanTree().save_stream(path, 9, chunk_size=100) == len(expected)
+        assert np.array_equal(np.load(path, mmap_mode="r"), expected)
+        path = os.path.join(directory, "stream.png")
+        assert PythagoreanTree().render_stream(9, path, chunk_size=100) == len(expected)
+        assert os.path.getsize(path) > 0
+    print("✓ Тест пройдено\n")
+    
+    # Тест 7: Генерація з таблиць поворотів
+    print("Тест 7: Таблиці поворотів дають ті самі лінії")
+    for level in range(0, 10):
+        expected = PythagoreanTree().create_tree_vectorized(level)
+        segments = PythagoreanTree().create_tree_table(level)
+        assert segments.shape == expected.shape
+        assert np.allclose(segments, expected, rtol=0, atol=1e-12), f"Неспівпадіння для рівня {level}"
+    print("✓ Тест пройдено\n")
+    
+    # Тест 8: Параметри дерева та сітка параметрів на пулі процесів
+    print("Тест 8: Налаштовувані параметри та паралельна сітка")
+    parameters = {"ratio": 0.6, "left_angle": np.pi / 6, "right_angle": np.pi / 3,
+                  "trunk": (1.0, -1.0, 2.0, 1.0)}
+    recursive_tree = PythagoreanTree(**parameters)
+    recursive_tree.create_tree(7)
+    expected = np.array(recursive_tree.lines, dtype=float)
+    assert np.array_equal(PythagoreanTree(**parameters).create_tree_vectorized(7), expected)
+    assert np.allclose(PythagoreanTree(**parameters).create_tree_table(7), expected, rtol=0, atol=1e-12)
+    streamed = np.concatenate(list(PythagoreanTree(**parameters).iter_segment_chunks(7, 10)))
+    assert np.array_equal(streamed, expected)
+    try:
+        PythagoreanTree(ratio=1.2)
+        assert False, "Коефіцієнт поза (0, 1) має викликати ValueError"
+    except ValueError:
+        pass
+    with tempfile.TemporaryDirectory() as directory:
+        result = render_parameter_sweep({"branch_angle": [np.pi / 6, np.pi / 4], "ratio": [0.6, 0.7]},
+                                        6, directory, workers=2, figsize=(4, 3), dpi=50)
+        assert len(result["paths"]) == 4 and result["trees_per_second"] > 0
+        assert all(os.path.getsize(path) > 0 for path in result["paths"])
+    print("✓ Тест пройдено\n")
+    
+    # Тест 9: Растеризатор NumPy і запис PNG без matplotlib
+    print("Тест 9: Растеризація ліній у буфер NumPy")
+    rasterizer = SegmentRasterizer(11, 11, (0.0, 10.0, 0.0, 10.0), antialias=False)
+    rasterizer.draw(np.array([[0.0, 5.0, 10.0, 5.0], [20.0, 20.0, 30.0, 30.0]]), (1.0, 0.0, 0.0))
+    image = rasterizer.image()
+    assert image[5].tolist() == [[255, 0, 0]] * 11, "Горизонтальна лінія має зафарбувати весь рядок"
+    assert (image[:5] == 255).all() and (image[6:] == 255).all(), "Лінія поза полотном не малюється"
+    smooth = SegmentRasterizer(11, 11, (0.0, 10.0, 0.0, 10.0), dtype=np.float32)
+    smooth.draw(np.array([[0.0, 5.5, 10.0, 5.5]]), (0.0, 0.0, 0.0))
+    assert np.allclose(smooth.canvas[3:7, 2:9, 0], [[1.0], [0.5], [0.5], [1.0]]), "Згладжування ділить покриття"
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "raster.png")
+        write_png(path, image)
+        assert np.array_equal(np.rint(plt.imread(path) * 255).astype(np.uint8), image)
+        path = os.path.join(directory, "tree.png")
+        assert PythagoreanTree().rasterize_stream(10, path, 320, 200, chunk_size=100,
+                                                  level_colors="viridis") == 2 ** 10 - 1
+        assert plt.imread(path).shape == (200, 320, 3)
+    print("✓ Тест пройдено\n")
+    
+    # Тест 10: Відсікання за viewport і рівнем деталізації
+    print("Тест 10: Генерація лише видимої частини дерева")
+    tree10 = PythagoreanTree()
+    full = tree10.create_tree_vectorized(12)
+    whole = tree10.estimate_bounds(12)
+    everything = tree10.create_tree_viewport(whole, pixel_size=1e-9, max_level=12)
+    assert sorted(map(tuple, everything)) == sorted(map(tuple, full)), "Без відсікання - усе дерево"
+    viewport = (3.0, 3.2, 3.0, 3.2)
+    visible = tree10.create_tree_viewport(viewport, pixel_size=1e-9, max_level=12)
+    samples = np.linspace(0, 1, 64)[:, None]
+    xs = full[:, 0] + samples * (full[:, 2] - full[:, 0])
+    ys = full[:, 1] + samples * (full[:, 3] - full[:, 1])
+    crossing = full[((xs >= 3.0) & (xs <= 3.2) & (ys >= 3.0) & (ys <= 3.2)).any(axis=0)]
+    kept = set(map(tuple, visible))
+    assert all(tuple(row) in kept for row in crossing), "Видимі лінії не мають відкидатися"
+    assert len(visible) < len(full) // 10
+    assert tree10.lod_level(pixel_size=2 * 0.7 ** 5) == 6
+    assert len(tree10.create_tree_viewport(whole, pixel_size=2 * 0.7 ** 5)) == 2 ** 6 - 1
+    print("✓ Тест пройдено\n")
+    
+    # Тест 11: Піраміда тайлів з кешем на диску
+    print("Тест 11: Піраміда тайлів z/x/y і кеш")
+    with tempfile.TemporaryDirectory() as directory:
+        pyramid = TilePyramid(PythagoreanTree(), directory, tile_size=32)
+        first = pyramid.render_pyramid(1, workers=2)
+        assert (first["rendered"], first["cached"]) == (5, 0)
+        assert plt.imread(pyramid.tile_path(1, 1, 0)).shape == (32, 32, 3)
+        again = pyramid.render_pyramid(1, workers=2)
+        assert (again["rendered"], again["cached"]) == (0, 5), "Повторний запуск бере тайли з кешу"
+        changed = TilePyramid(PythagoreanTree(ratio=0.6), directory, tile_size=32)
+        assert changed.key != pyramid.key
+        assert changed.render_tiles([(0, 0, 0), (1, 0, 1)], workers=1)["rendered"] == 2
+        xmin, xmax, ymin, ymax = pyramid.tile_viewport(1, 0, 0)
+        assert (xmin, ymax) == (pyramid.world[0], pyramid.world[3]), "Тайл y=0 - верхній лівий"
+        try:
+            pyramid.tile_viewport(1, 2, 0)
+            assert False, "Тайл поза пірамідою має викликати ValueError"
+        except ValueError:
+            pass
+    print("✓ Тест пройдено\n")
+    
+    # Тест 12: Класичне дерево Піфагора з квадратів
+    print("Тест 12: Дерево з квадратів")
+    tree12 = PythagoreanTree()
+    squares = tree12.create_square_tree(6, angle=np.pi / 6)
+    assert squares.shape == (2 ** 6 - 1, 4, 2)
+    assert np.allclose(squares[0], [[-1, 0], [1, 0], [1, 2], [-1, 2]])
+    edges = np.roll(squares, -1, axis=1) - squares
+    sides = np.hypot(edges[..., 0], edges[..., 1])
+    assert np.allclose(sides, sides[:, :1]), "Усі сторони квадрата рівні"
+    assert np.allclose(np.einsum("nij,nij->ni", edges, np.roll(edges, -1, axis=1)), 0), "Кути прямі"
+    # Діти стоять на верхній стороні батька, а їхні основи утворюють прямий кут
+    parents, left, right = squares[:31], squares[1::2], squares[2::2]
+    assert np.allclose(left[:, 0], parents[:, 3]) and np.allclose(right[:, 1], parents[:, 2])
+    assert np.allclose(left[:, 1], right[:, 0])
+    assert np.allclose(sides[1::2, 0], sides[:31, 0] * np.cos(np.pi / 6))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "squares.png")
+        tree12.render_squares(path, edgecolor="k")
+        assert os.path.getsize(path) > 0
+    print("✓ Тест пройдено\n")
 
 
 def main():
@@ -226,9 +1835,10 @@ def main():
         print("1. Інтерактивний режим (введіть свій рівень рекурсії)")
         print("2. Демонстрація з різними рівнями")
         print("3. Тестування функцій")
-        print("4. Вихід")
+        print("4. Бенчмарки продуктивності")
+        print("5. Вихід")
         
-        choice = input("\nВаш вибір (1-4): ").strip()
+        choice = input("\nВаш вибір (1-5): ").strip()
         
         if choice == '1':
             interactive_mode()
@@ -237,10 +1847,12 @@ def main():
         elif choice == '3':
             test_recursive_function()
         elif choice == '4':
+            run_benchmarks()
+        elif choice == '5':
             print("Дякуємо за використання програми!")
             break
         else:
-            print("Будь ласка, виберіть опцію від 1 до 4!")
+            print("Будь ласка, виберіть опцію від 1 до 5!")
 
 
 if __name__ == "__main__":